@@ -1,15 +1,54 @@
 import time
+from ai.prompt_builder import PromptBuilder
 
 class BaseAIProcessor:
     """Base class for AI processing"""
     
-    def __init__(self, name):
+    # Whether the model can switch live web search on and off per request
+    supports_grounding = False
+    
+    def __init__(self, name, prompt_builder=None):
         self.name = name
+        self.prompt_builder = prompt_builder if prompt_builder else PromptBuilder()
     
-    def process_text(self, text):
-        """Process text with the AI model and return the answer"""
+    def process_text(self, text, grounded=True, timeout=None):
+        """Process text with the AI model and return the answer
+        
+        grounded=False asks processors that support it to skip web search.
+        timeout, in seconds, bounds the request where the client allows it.
+        Processors that can score the options themselves also return a
+        "confidence" for the chosen one.
+        """
         start_time = time.time()
-        result = self._execute_model_request(text)
+        parsed = self.prompt_builder.parse(text)
+        prompt = self.prompt_builder.build_user_prompt(parsed)
+        
+        choice = self._execute_choice_request(prompt, parsed, timeout) if parsed.choices else None
+        if choice:
+            result, confidence = choice
+        else:
+            result, confidence = self._execute_model_request(prompt, grounded, timeout), None
+        
+        result = self.prompt_builder.resolve_answer(result, parsed)
+        elapsed_time = time.time() - start_time
+        
+        result_data = {
+            "result": result,
+            "time": elapsed_time,
+            "grounded": grounded and self.supports_grounding
+        }
+        if confidence is not None:
+            result_data["confidence"] = confidence
+        return result_data
+    
+    def process_image(self, image_bytes, mime_type="image/jpeg", timeout=None):
+        """Answer the question shown in an encoded image, skipping OCR
+        
+        timeout, in seconds, bounds the request where the client allows it.
+        """
+        start_time = time.time()
+        result = self._execute_image_request(image_bytes, mime_type, timeout)
+        result = result.strip().strip("*").strip() if result else result
         elapsed_time = time.time() - start_time
         
         return {
@@ -17,6 +56,22 @@ class BaseAIProcessor:
             "time": elapsed_time
         }
     
-    def _execute_model_request(self, text):
+    @property
+    def supports_images(self):
+        """Whether this processor accepts image input"""
+        return type(self)._execute_image_request is not BaseAIProcessor._execute_image_request
+    
+    def _execute_image_request(self, image_bytes, mime_type, timeout=None):
+        """Execute a multimodal request - implemented by subclasses whose models accept images"""
+        raise NotImplementedError(f"{self.name} does not accept image input")
+    
+    def _execute_choice_request(self, text, parsed, timeout=None):
+        """Pick an option letter with a confidence - implemented by subclasses that can constrain output
+        
+        Returns (letter, confidence), or None to fall back to a free-text request.
+        """
+        return None
+    
+    def _execute_model_request(self, text, grounded=True, timeout=None):
         """Execute the actual model request - to be implemented by subclasses"""
         raise NotImplementedError("Subclasses must implement _execute_model_request") 
\ No newline at end of file
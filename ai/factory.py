@@ -0,0 +1,27 @@
+def create_ai_processors(config):
+    """Create the AI processors used by the triple check workflows, keyed by model name"""
+    from ai.perplexity import PerplexityProcessor
+    from ai.gpt4 import GPT4Processor
+    from ai.gemini import GeminiProcessor
+    
+    ai_processors = {
+        "gpt4": GPT4Processor(
+            config.openai_api_key,
+            constrained=config.gpt4_constrained,
+            confidence_temperature=config.gpt4_confidence_temperature,
+            base_url=config.openai_base_url
+        ),
+        "sonar_pro": PerplexityProcessor(config.perplexity_api_key, model="sonar-pro"),
+        "sonar": PerplexityProcessor(config.perplexity_api_key, model="sonar"),
+        "gemini": GeminiProcessor(config.google_api_key,model="gemini-2.0-flash")
+    }
+    
+    # Optional local answerer gives a first opinion while the cloud models are in flight
+    if config.local_model_path:
+        from ai.local import LocalProcessor
+        try:
+            ai_processors["local"] = LocalProcessor(config.local_model_path)
+        except Exception as e:
+            print(f"Local answerer disabled: {e}")
+    
+    return ai_processors
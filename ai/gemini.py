@@ -2,9 +2,18 @@ from google import genai
 from google.genai import types
 from ai.base_processor import BaseAIProcessor
 
+# Smallest prefix, in tokens, the API accepts for explicit caching
+MIN_CACHE_TOKENS = {
+    "gemini-2.5-flash": 1024,
+    "gemini-2.5-pro": 4096
+}
+DEFAULT_MIN_CACHE_TOKENS = 4096
+
 class GeminiProcessor(BaseAIProcessor):
     """Handles processing text using Google Gemini API with Google Search grounding"""
     
+    supports_grounding = True
+    
     def __init__(self, api_key, model="gemini-2.0-flash"):
         super().__init__(f"Gemini {model}")
         self.api_key = api_key
@@ -13,29 +22,88 @@ class GeminiProcessor(BaseAIProcessor):
         # Configure the Google Gemini client
         self.client = genai.Client(api_key=api_key)
         
-    def _execute_model_request(self, text):
-        """Send extracted text to Google Gemini API for MCQ analysis with Google Search grounding"""
-        print(f"Processing text with Gemini {self.model} using Google Search grounding...")
+        # The static request parts are built once and reused on every call
+        self.tools = [types.Tool(google_search=types.GoogleSearchRetrieval())]
+        self.cached_content = self._create_cached_content()
+        self.request_config = self._build_request_config()
+        
+        # Without the search tool, for static-fact questions
+        self.ungrounded_request_config = types.GenerateContentConfig(
+            system_instruction=self.prompt_builder.system_prompt,
+            temperature=0.1,
+            max_output_tokens=self.prompt_builder.max_output_tokens
+        )
+        self.image_request_config = types.GenerateContentConfig(
+            system_instruction=self.prompt_builder.image_prompt,
+            temperature=0.1,
+            max_output_tokens=self.prompt_builder.image_max_output_tokens,
+            tools=self.tools
+        )
+    
+    def _create_cached_content(self, ttl="3600s"):
+        """Cache the system instruction and tools server-side so calls skip their prefill
+        
+        Explicit caching requires a minimum prefix size, which the compact system
+        prompt is far below, so the prefix is only cached once it grows past it.
+        Estimated locally at about four characters per token to avoid spending a
+        request at startup on a cache the API would reject.
+        """
+        estimated_tokens = len(self.prompt_builder.system_prompt) // 4
+        if estimated_tokens < MIN_CACHE_TOKENS.get(self.model, DEFAULT_MIN_CACHE_TOKENS):
+            return None
         
         try:
-            # Create a prompt that incorporates the system instructions and the text to analyze
-            prompt = f"""You are an assistant and finance expert that analyzes multiple choice questions and determines the correct answer.
-            
-            This image contains a multiple choice question. Using the latest accurate information from search results, tell me which answer is correct. Only tell me the correct answer letter (A, B, C, D, etc.), no explanation needed.
-            
-            Question: {text}"""
-            
-            # Send the request with Google Search grounding enabled
-            response = self.client.models.generate_content(
+            cache = self.client.caches.create(
                 model=self.model,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.1,  # Low temperature for focused, accurate responses
-                    tools=[types.Tool(
-                        google_search=types.GoogleSearchRetrieval()
-                    )]
+                config=types.CreateCachedContentConfig(
+                    system_instruction=self.prompt_builder.system_prompt,
+                    tools=self.tools,
+                    ttl=ttl
                 )
             )
+            print(f"Using cached prompt prefix for Gemini {self.model}")
+            return cache.name
+        except Exception as e:
+            print(f"Gemini {self.model} prompt caching unavailable, sending prefix inline: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _is_cache_missing(error):
+        """Whether an API error means the cached prefix expired or was evicted"""
+        return getattr(error, "code", None) in (403, 404) and "cached" in str(error).lower()
+    
+    def _build_request_config(self):
+        """Build the generation config shared by every request"""
+        options = {
+            "temperature": 0.1,  # Low temperature for focused, accurate responses
+            "max_output_tokens": self.prompt_builder.max_output_tokens
+        }
+        
+        # Cached content already carries the system instruction and tools
+        if self.cached_content:
+            return types.GenerateContentConfig(cached_content=self.cached_content, **options)
+        
+        return types.GenerateContentConfig(
+            system_instruction=self.prompt_builder.system_prompt,
+            tools=self.tools,
+            **options
+        )
+    
+    def _execute_model_request(self, text, grounded=True, timeout=None):
+        """Send extracted text to Google Gemini API for MCQ analysis, with Google Search grounding when asked"""
+        print(f"Processing text with Gemini {self.model}{' using Google Search grounding' if grounded else ''}...")
+        
+        config = self.request_config if grounded else self.ungrounded_request_config
+        if timeout:
+            config = config.model_copy(update={"http_options": types.HttpOptions(timeout=int(timeout * 1000))})
+        
+        try:
+            # Send the compact prompt with Google Search grounding enabled
+            response = self.client.models.generate_content(
+                model=self.model,
+                contents=text,
+                config=config
+            )
             
             # Extract the answer
             answer = response.text.strip() if hasattr(response, 'text') else response.candidates[0].content.parts[0].text
@@ -51,4 +119,30 @@ class GeminiProcessor(BaseAIProcessor):
             
         except Exception as e:
             print(f"Error ({self.model}): {str(e)}")
-            return f"Failed to process with {self.model}: {str(e)}"
\ No newline at end of file
+            
+            # An expired or evicted cache fails every call, so fall back to the inline prefix
+            if self.cached_content and self._is_cache_missing(e):
+                self.cached_content = None
+                self.request_config = self._build_request_config()
+            
+            return f"Failed to process with {self.model}: {str(e)}"
+    
+    def _execute_image_request(self, image_bytes, mime_type, timeout=None):
+        """Send the captured frame straight to Gemini, which reads the question itself"""
+        print(f"Processing image with Gemini {self.model}...")
+        
+        config = self.image_request_config
+        if timeout:
+            config = config.model_copy(update={"http_options": types.HttpOptions(timeout=int(timeout * 1000))})
+        
+        try:
+            response = self.client.models.generate_content(
+                model=self.model,
+                contents=[types.Part.from_bytes(data=image_bytes, mime_type=mime_type)],
+                config=config
+            )
+            return response.text
+            
+        except Exception as e:
+            print(f"Error ({self.model} image): {str(e)}")
+            return f"Failed to process image with {self.model}: {str(e)}"
\ No newline at end of file
@@ -1,42 +1,133 @@
+import base64
+import math
 import requests
 from ai.base_processor import BaseAIProcessor
+from ai.request_template import ChatRequestTemplate
+from ai.prompt_builder import OPTION_LETTERS
+
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+def _letter_token_ids(model):
+    """Token ids of the single option letters, so logit bias can restrict output to them"""
+    try:
+        import tiktoken
+        encoding = tiktoken.encoding_for_model(model)
+        return {letter: encoding.encode(letter)[0] for letter in OPTION_LETTERS}
+    except (ImportError, KeyError):
+        # cl100k_base and o200k_base both number printable ASCII from "!" = 0
+        return {letter: ord(letter) - ord("!") for letter in OPTION_LETTERS}
 
 class GPT4Processor(BaseAIProcessor):
-    """Handles processing text using OpenAI's GPT-4"""
+    """Handles processing text using OpenAI's GPT-4
+    
+    In constrained mode, multiple choice questions are answered with a single
+    token: logit bias limits the output to the option letters and the
+    returned logprobs give a confidence for the chosen letter.
+    """
     
-    def __init__(self, api_key, model="gpt-4-turbo"):
+    def __init__(self, api_key, model="gpt-4-turbo", image_detail="low", constrained=False,
+                 confidence_temperature=1.0, base_url=OPENAI_BASE_URL):
         super().__init__("GPT-4 Turbo")
         self.api_key = api_key
         self.model = model
-    
-    def _execute_model_request(self, text):
-        """Send text to OpenAI's GPT-4-Turbo for MCQ analysis"""
-        print("Processing text with GPT-4-Turbo...")
+        self.url = f"{base_url.rstrip('/')}/chat/completions"
+        
+        # Constrained single-token answering; temperature > 1 softens overconfident letter probabilities
+        self.constrained = constrained
+        self.confidence_temperature = confidence_temperature
+        self.letter_token_ids = _letter_token_ids(model)
+        self.choice_request_templates = {}
         
-        headers = {
+        # Static headers and request prefix are built once and reused on every call
+        self.headers = {
             "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
+            "Authorization": f"Bearer {api_key}"
         }
+        self.request_template = ChatRequestTemplate(
+            model,
+            self.prompt_builder.system_prompt,
+            max_tokens=self.prompt_builder.max_output_tokens
+        )
+        self.image_request_template = ChatRequestTemplate(
+            model,
+            self.prompt_builder.image_prompt,
+            max_tokens=self.prompt_builder.image_max_output_tokens
+        )
         
-        payload = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are an assistant and financial expert that analyzes multiple choice questions and determines the correct answer."
-                },
-                {
-                    "role": "user",
-                    "content": f"This contains a multiple choice question. Tell me which answer is correct. Only tell me the correct answer, no explanation needed.\n\n{text}"
-                }
-            ],
-            "max_tokens": 100
-        }
+        # "low" sends a single 512px tile, which is much faster and usually enough for on-screen text
+        self.image_detail = image_detail
+    
+    def _choice_request_template(self, option_count):
+        """Return the one-token, letter-restricted request template for a number of options"""
+        template = self.choice_request_templates.get(option_count)
+        if template is None:
+            letters = OPTION_LETTERS[:option_count]
+            template = ChatRequestTemplate(
+                self.model,
+                self.prompt_builder.system_prompt,
+                max_tokens=1,
+                temperature=0,
+                logit_bias={str(self.letter_token_ids[letter]): 100 for letter in letters},
+                logprobs=True,
+                top_logprobs=option_count
+            )
+            self.choice_request_templates[option_count] = template
+        return template
+    
+    def letter_confidences(self, top_logprobs, letters):
+        """Turn the first token's top logprobs into a probability per option letter
+        
+        Letters missing from the top list get the smallest listed logprob, then
+        the temperature-scaled scores are normalized over the options only.
+        """
+        logprobs = {}
+        for entry in top_logprobs:
+            letter = entry["token"].strip().upper()
+            if letter in letters and letter not in logprobs:
+                logprobs[letter] = entry["logprob"]
+        
+        floor = min(logprobs.values()) if logprobs else 0.0
+        scores = {letter: math.exp(logprobs.get(letter, floor) / self.confidence_temperature) for letter in letters}
+        total = sum(scores.values())
+        return {letter: score / total for letter, score in scores.items()}
+    
+    def _execute_choice_request(self, text, parsed, timeout=None):
+        """Answer with one option letter and its confidence, restricted by logit bias"""
+        if not self.constrained:
+            return None
+        print("Processing text with GPT-4-Turbo (single token)...")
         
+        letters = OPTION_LETTERS[:len(parsed.choices)]
         response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers=headers,
-            json=payload
+            self.url,
+            headers=self.headers,
+            data=self._choice_request_template(len(letters)).render(text),
+            timeout=timeout
+        )
+        
+        if response.status_code != 200:
+            print(f"Error (GPT-4): {response.status_code}")
+            print(response.text)
+            return None
+        
+        choice = response.json()["choices"][0]
+        letter = choice["message"]["content"].strip().upper()
+        top_logprobs = (choice.get("logprobs") or {}).get("content") or []
+        if not top_logprobs:
+            return letter, None
+        
+        confidences = self.letter_confidences(top_logprobs[0]["top_logprobs"], letters)
+        return letter, round(confidences.get(letter, 0.0), 3)
+    
+    def _execute_model_request(self, text, grounded=True, timeout=None):
+        """Send text to OpenAI's GPT-4-Turbo for MCQ analysis"""
+        print("Processing text with GPT-4-Turbo...")
+        
+        response = requests.post(
+            self.url,
+            headers=self.headers,
+            data=self.request_template.render(text),
+            timeout=timeout
         )
         
         if response.status_code != 200:
@@ -46,4 +137,26 @@ class GPT4Processor(BaseAIProcessor):
         
         response_data = response.json()
         answer = response_data["choices"][0]["message"]["content"]
-        return answer 
\ No newline at end of file
+        return answer
+    
+    def _execute_image_request(self, image_bytes, mime_type, timeout=None):
+        """Send the captured frame straight to GPT-4, which reads the question itself"""
+        print("Processing image with GPT-4-Turbo...")
+        
+        image_url = f"data:{mime_type};base64,{base64.b64encode(image_bytes).decode('ascii')}"
+        content = [{"type": "image_url", "image_url": {"url": image_url, "detail": self.image_detail}}]
+        
+        response = requests.post(
+            self.url,
+            headers=self.headers,
+            data=self.image_request_template.render(content),
+            timeout=timeout
+        )
+        
+        if response.status_code != 200:
+            print(f"Error (GPT-4 image): {response.status_code}")
+            print(response.text)
+            return "Failed to process image with GPT-4"
+        
+        response_data = response.json()
+        return response_data["choices"][0]["message"]["content"]
\ No newline at end of file
@@ -0,0 +1,48 @@
+import re
+import time
+
+# Words that signal the answer depends on recent or changing information
+RECENCY_PATTERN = re.compile(
+    r"\b(current(ly)?|latest|recent(ly)?|newest|today|now|so far|as of|this (week|month|quarter|year)|"
+    r"last (week|month|quarter|year)|year[- ]to[- ]date|ytd|upcoming)\b",
+    re.IGNORECASE
+)
+
+# Market data and deals that move: prices, valuations, returns, rankings
+VOLATILE_PATTERN = re.compile(
+    r"(\$|%|\b(price|priced|market cap|valuation|trillion|billion|returns?|gained|lost|highest|lowest|"
+    r"rank(ed)?|acquir\w*|merger|announced|launched)\b)",
+    re.IGNORECASE
+)
+
+# Explicit dates: 12/31/24, 2024-12-31, or a bare year
+DATE_PATTERN = re.compile(r"\b\d{1,2}/\d{1,2}/\d{2,4}\b|\b\d{4}-\d{2}-\d{2}\b")
+YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
+
+def needs_grounding(parsed, recent_years=3):
+    """Return (grounded, reason): whether a question needs live web search to answer reliably
+    
+    Static facts (definitions, founding dates of old institutions, how things
+    work) are answered from model knowledge; anything about recent years,
+    prices, rankings or named recent events gets search grounding.
+    """
+    text = " ".join([parsed.question] + parsed.choices)
+    
+    match = RECENCY_PATTERN.search(text)
+    if match:
+        return True, f"recency: '{match.group(0)}'"
+    
+    match = DATE_PATTERN.search(text)
+    if match:
+        return True, f"date: '{match.group(0)}'"
+    
+    this_year = time.localtime().tm_year
+    for match in YEAR_PATTERN.finditer(text):
+        if int(match.group(0)) >= this_year - recent_years:
+            return True, f"recent year: '{match.group(0)}'"
+    
+    match = VOLATILE_PATTERN.search(parsed.question)
+    if match:
+        return True, f"volatile: '{match.group(0)}'"
+    
+    return False, "static fact"
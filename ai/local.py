@@ -0,0 +1,57 @@
+import os
+import threading
+from ai.base_processor import BaseAIProcessor
+
+class LocalProcessor(BaseAIProcessor):
+    """Handles processing text with a small quantized LLM running locally on the CPU via llama.cpp"""
+    
+    def __init__(self, model_path, n_threads=None, n_ctx=512):
+        super().__init__(f"Local {os.path.basename(model_path)}")
+        self.model_path = model_path
+        
+        try:
+            from llama_cpp import Llama
+        except ImportError:
+            raise ImportError("llama-cpp-python is required for the local answerer: pip install llama-cpp-python")
+        
+        # Load once up front so the first question doesn't pay the model load time
+        self.llm = Llama(
+            model_path=model_path,
+            n_ctx=n_ctx,
+            n_threads=n_threads if n_threads else os.cpu_count(),
+            n_gpu_layers=0,
+            verbose=False
+        )
+        
+        # A llama.cpp context is not thread-safe, and abandoned or speculative calls can still be running
+        self.lock = threading.Lock()
+    
+    def _execute_model_request(self, text, grounded=True, timeout=None):
+        """Answer the question with the local model
+        
+        Generation is a few tokens and can't be interrupted, so timeout only
+        bounds the wait for a call still running on the model to finish.
+        """
+        print(f"Processing text with {self.name}...")
+        
+        if not self.lock.acquire(timeout=timeout if timeout is not None else -1):
+            print(f"Error ({self.name}): model busy with an earlier question")
+            return f"Failed to process with {self.name}"
+        
+        try:
+            response = self.llm.create_chat_completion(
+                messages=[
+                    {"role": "system", "content": self.prompt_builder.system_prompt},
+                    {"role": "user", "content": text}
+                ],
+                max_tokens=self.prompt_builder.max_output_tokens,
+                temperature=0.0
+            )
+            return response["choices"][0]["message"]["content"]
+        
+        except Exception as e:
+            print(f"Error ({self.name}): {str(e)}")
+            return f"Failed to process with {self.name}"
+        
+        finally:
+            self.lock.release()
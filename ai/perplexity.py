@@ -1,41 +1,47 @@
 import requests
 from ai.base_processor import BaseAIProcessor
+from ai.request_template import ChatRequestTemplate
 
 class PerplexityProcessor(BaseAIProcessor):
     """Handles processing text using Perplexity API"""
     
+    supports_grounding = True
+    
     def __init__(self, api_key, model="sonar-pro"):
         super().__init__(f"Perplexity {model}")
         self.api_key = api_key
         self.model = model
-    
-    def _execute_model_request(self, text):
-        """Send extracted text to Perplexity API for MCQ analysis"""
-        print(f"Processing text with Perplexity {self.model}...")
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
+        # Static headers and request prefix are built once and reused on every call
+        self.headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}"
         }
+        self.request_template = ChatRequestTemplate(
+            model,
+            self.prompt_builder.system_prompt,
+            max_tokens=self.prompt_builder.max_output_tokens
+        )
         
-        payload = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are an assistant and finance expert that analyzes multiple choice questions and determines the correct answer."
-                },
-                {
-                    "role": "user",
-                    "content": f"This image contains a multiple choice question. Using the latest information tell me which answer is correct. Only tell me the correct answer, no explanation needed.\n\n{text}"
-                }
-            ]
-        }
+        # Same request with web search turned off, for static-fact questions
+        self.ungrounded_request_template = ChatRequestTemplate(
+            model,
+            self.prompt_builder.system_prompt,
+            max_tokens=self.prompt_builder.max_output_tokens,
+            disable_search=True
+        )
+    
+    def _execute_model_request(self, text, grounded=True, timeout=None):
+        """Send extracted text to Perplexity API for MCQ analysis"""
+        print(f"Processing text with Perplexity {self.model}{'' if grounded else ' (no search)'}...")
+        
+        request_template = self.request_template if grounded else self.ungrounded_request_template
         
         response = requests.post(
             "https://api.perplexity.ai/chat/completions",
-            headers=headers,
-            json=payload
+            headers=self.headers,
+            data=request_template.render(text),
+            timeout=timeout
         )
         
         if response.status_code != 200:
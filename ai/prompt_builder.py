@@ -0,0 +1,140 @@
+import re
+
+OPTION_LETTERS = "ABCDEF"
+
+# Lines that are pure UI noise above the question: player counts ("134,880"),
+# countdown timers ("0:08", "10") and stray glyphs ("O", "L")
+NOISE_LINE = re.compile(r"^[\d\s,.:]*$|^\W*\w?\W*$")
+
+# Banner shown over the question once the countdown ends
+TIMES_UP = re.compile(r"time'?s up", re.IGNORECASE)
+
+# Sponsor logos as OCR'd below the options; tickers and acronyms are real options, so only known logos are dropped
+SPONSOR_LOGOS = {"gocla"}
+
+def _normalize(text):
+    """Lowercase text with punctuation and extra whitespace removed, for loose comparison"""
+    return " ".join(re.sub(r"[^\w\s]", " ", text.lower()).split())
+
+class ParsedQuestion:
+    """Question and answer choices extracted from raw OCR text"""
+    
+    def __init__(self, question, choices, raw_text):
+        self.question = question
+        self.choices = choices
+        self.raw_text = raw_text
+    
+    def letter_for(self, index):
+        """Return the option letter for a choice index"""
+        return OPTION_LETTERS[index]
+    
+    def choice_for(self, letter):
+        """Return the choice text for an option letter, or None"""
+        index = OPTION_LETTERS.find(letter.upper())
+        if 0 <= index < len(self.choices):
+            return self.choices[index]
+        return None
+
+class PromptBuilder:
+    """Builds compact, letter-indexed prompts shared by every AI processor"""
+    
+    SYSTEM_PROMPT = "Answer the trivia question. Reply with the correct option letter only, or a few words if no options are given."
+    IMAGE_PROMPT = "The image shows a multiple choice trivia question. Reply with the exact text of the correct option only."
+    
+    def __init__(self, max_output_tokens=8, image_max_output_tokens=20):
+        self.system_prompt = self.SYSTEM_PROMPT
+        self.image_prompt = self.IMAGE_PROMPT
+        self.max_output_tokens = max_output_tokens
+        
+        # Image answers are option text rather than a letter, so they need more room
+        self.image_max_output_tokens = image_max_output_tokens
+    
+    @staticmethod
+    def parse(text):
+        """Split OCR text into the question and its choices, dropping UI noise"""
+        lines = [line.strip() for line in (text or "").splitlines()]
+        lines = [line for line in lines if line]
+        
+        # The question ends at the first line with a question mark
+        question_end = next((i for i, line in enumerate(lines) if line.endswith("?")), None)
+        if question_end is None:
+            kept = [line for line in lines if not NOISE_LINE.match(line)]
+            return ParsedQuestion(" ".join(kept), [], text)
+        
+        # Everything above the question mark that isn't noise is part of the question
+        question_lines = [
+            line for line in lines[:question_end + 1]
+            if not NOISE_LINE.match(line) and not TIMES_UP.fullmatch(line)
+        ]
+        
+        # Numeric choices are legitimate below the question, only stray letter glyphs are dropped
+        choices = [
+            line for line in lines[question_end + 1:]
+            if (len(line) > 1 or line.isdigit()) and line.lower() not in SPONSOR_LOGOS
+        ]
+        
+        return ParsedQuestion(" ".join(question_lines), choices[:len(OPTION_LETTERS)], text)
+    
+    def build_user_prompt(self, parsed):
+        """Format a parsed question as a compact letter-indexed prompt"""
+        if not parsed.choices:
+            return parsed.question
+        
+        options = "\n".join(f"{parsed.letter_for(i)}) {choice}" for i, choice in enumerate(parsed.choices))
+        return f"{parsed.question}\n{options}"
+    
+    @staticmethod
+    def resolve_answer(answer, parsed):
+        """Map a model's letter answer back to the choice text so results compare cleanly"""
+        if not answer:
+            return answer
+        
+        cleaned = answer.strip().strip("*").strip()
+        match = re.match(r"^\(?([A-Fa-f])\)?(?:[.):]|$)", cleaned)
+        if match:
+            choice = parsed.choice_for(match.group(1))
+            if choice:
+                return choice
+        
+        # Answers given as option text (e.g. from the image path) snap to the OCR'd choice
+        normalized = _normalize(cleaned)
+        for choice in parsed.choices:
+            if _normalize(choice) == normalized:
+                return choice
+        
+        return cleaned
+    
+    @staticmethod
+    def match_choice(answer, parsed, min_overlap=0.6):
+        """Match a free-text answer, given before the options were known, to exactly one choice
+        
+        Tries an exact match, then one choice containing the other, then the
+        best word overlap. Returns None when no single choice clearly matches.
+        """
+        normalized = _normalize(answer or "")
+        if not normalized:
+            return None
+        
+        choices = {choice: _normalize(choice) for choice in parsed.choices}
+        for choice, choice_text in choices.items():
+            if choice_text == normalized:
+                return choice
+        
+        # Whole-word containment, so a choice like "10" doesn't match inside "1000"
+        padded = f" {normalized} "
+        containing = [
+            choice for choice, choice_text in choices.items()
+            if choice_text and (f" {choice_text} " in padded or padded in f" {choice_text} ")
+        ]
+        if len(containing) == 1:
+            return containing[0]
+        
+        answer_words = set(normalized.split())
+        overlaps = {
+            choice: len(answer_words & set(choice_text.split())) / len(answer_words | set(choice_text.split()))
+            for choice, choice_text in choices.items()
+        }
+        best = sorted(overlaps, key=overlaps.get, reverse=True)
+        if best and overlaps[best[0]] >= min_overlap and (len(best) == 1 or overlaps[best[1]] < overlaps[best[0]]):
+            return best[0]
+        return None
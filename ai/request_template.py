@@ -0,0 +1,38 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+USER_CONTENT_MARKER = "\x00user_content\x00"
+
+def _dumps(value):
+    """Serialize a value to compact JSON bytes, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+class ChatRequestTemplate:
+    """Pre-serialized chat completion body with a fixed prefix and a per-call user message
+    
+    The static part of the request (model, options, system prompt) is encoded once
+    and reused as bytes. The system message always comes first so the byte prefix
+    is identical on every call, which is what provider-side prefix caching keys on.
+    """
+    
+    def __init__(self, model, system_prompt, **options):
+        payload = {"model": model}
+        payload.update(options)
+        payload["messages"] = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": USER_CONTENT_MARKER}
+        ]
+        
+        encoded = _dumps(payload)
+        marker = _dumps(USER_CONTENT_MARKER)
+        self.prefix, self.suffix = encoded.split(marker)
+    
+    def render(self, user_content):
+        """Return the full JSON request body for a user message"""
+        return self.prefix + _dumps(user_content) + self.suffix
@@ -0,0 +1,106 @@
+import argparse
+import concurrent.futures
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.deadline import Deadline, DeadlineScheduler, LatencyTracker
+
+# Latency (typical low, typical high, tail) and accuracy per model, from the recorded contest log
+MODELS = {
+    "gpt4": ((0.7, 1.4, 4.4), 0.85),
+    "sonar": ((1.4, 1.9, 5.6), 0.85),
+    "sonar_pro": ((2.2, 3.3, 6.0), 0.9),
+    "gemini": ((0.8, 1.3, 4.0), 0.85),
+}
+OCR_LATENCY = (0.27, 0.54, 2.0)
+TAIL_PROBABILITY = 0.1
+
+def sample_latency(rng, latency):
+    low, high, tail = latency
+    return tail * rng.uniform(0.8, 1.2) if rng.random() < TAIL_PROBABILITY else rng.uniform(low, high)
+
+def sample_question(rng, min_countdown, max_countdown):
+    """Seconds left on the timer at capture, OCR latency, and each model's latency and correctness"""
+    countdown = rng.uniform(min_countdown, max_countdown)
+    ocr = sample_latency(rng, OCR_LATENCY)
+    models = {
+        name: (sample_latency(rng, latency), rng.random() < accuracy)
+        for name, (latency, accuracy) in MODELS.items()
+    }
+    return countdown, ocr, models
+
+def majority_correct(correctness):
+    """Whether the plurality of the given answers is correct (wrong answers assumed to split)"""
+    return sum(correctness) * 2 > len(correctness)
+
+def wait_for_all(question, margin):
+    """Old behaviour: OCR, then wait for every model with no timeouts"""
+    countdown, ocr, models = question
+    finished = ocr + max(latency for latency, _ in models.values())
+    on_time = finished <= countdown - margin
+    return on_time, on_time and majority_correct([correct for _, correct in models.values()])
+
+def scheduled(question, margin, latency, scale):
+    """Deadline scheduler, run for real with sleeps scaled down by scale"""
+    countdown, ocr, models = question
+    deadline = Deadline(countdown * scale, margin * scale)
+    scheduler = DeadlineScheduler(deadline, latency, consensus_reserve=0.1 * scale)
+    
+    # OCR that runs past its timeout loses the question
+    ocr_timeout = scheduler.ocr_timeout()
+    time.sleep(min(ocr * scale, ocr_timeout))
+    if ocr * scale > ocr_timeout:
+        return False, False
+    
+    def task(name):
+        def run(timeout):
+            model_latency, correct = models[name]
+            if model_latency * scale > timeout:
+                time.sleep(timeout)
+                raise TimeoutError("request timed out")
+            time.sleep(model_latency * scale)
+            return {"result": correct, "time": model_latency}
+        return run
+    
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(models))
+    results, _, _ = scheduler.run(executor, {name: task(name) for name in models})
+    executor.shutdown(wait=False)
+    
+    answers = [data["result"] for data in results.values() if not isinstance(data["result"], str)]
+    on_time = bool(answers) and not deadline.expired()
+    return on_time, on_time and majority_correct(answers)
+
+def main():
+    """Simulate on-time answer rate with and without the deadline scheduler"""
+    parser = argparse.ArgumentParser(description="Simulate the deadline scheduler against waiting for every model")
+    parser.add_argument("--questions", type=int, default=200, help="Simulated questions")
+    parser.add_argument("--min-countdown", type=float, default=2.0, help="Fewest seconds left on the timer at capture")
+    parser.add_argument("--max-countdown", type=float, default=10.0, help="Most seconds left on the timer at capture")
+    parser.add_argument("--margin", type=float, default=1.0, help="Seconds kept back for the player to tap the answer")
+    parser.add_argument("--scale", type=float, default=0.02, help="Real seconds per simulated second")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    questions = [sample_question(rng, args.min_countdown, args.max_countdown) for _ in range(args.questions)]
+    
+    # Shared across questions, so slow models learned early are skipped when time is short
+    latency = LatencyTracker()
+    
+    baseline = [wait_for_all(question, args.margin) for question in questions]
+    with_deadline = [scheduled(question, args.margin, latency, args.scale) for question in questions]
+    
+    print(f"{args.questions} questions, {args.min_countdown:.0f}-{args.max_countdown:.0f}s left at capture, "
+          f"{args.margin:.1f}s margin, {TAIL_PROBABILITY:.0%} tail latency per call")
+    print("-" * 60)
+    for label, outcomes in (("wait for all", baseline), ("deadline scheduler", with_deadline)):
+        on_time = sum(on_time for on_time, _ in outcomes) / len(outcomes)
+        correct = sum(correct for _, correct in outcomes) / len(outcomes)
+        print(f"{label:20s} on time {on_time:6.1%}   correct and on time {correct:6.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections import deque
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from camera.focus import focus_measure, sharpest_frame
+
+def time_metric(width, height, runs=200):
+    """Return the mean focus metric cost in milliseconds for a frame size"""
+    frame = np.random.default_rng(0).integers(0, 256, (height, width, 3), dtype=np.uint8)
+    start = time.perf_counter()
+    for _ in range(runs):
+        focus_measure(frame)
+    return 1000 * (time.perf_counter() - start) / runs
+
+def is_ocr_failure(ocr_processor, frame):
+    """True when OCR finds no question in the frame"""
+    import cv2
+    from ai.prompt_builder import PromptBuilder
+    
+    ok, encoded = cv2.imencode(".jpg", frame)
+    text = ocr_processor.extract_text_from_bytes(encoded.tobytes()) if ok else None
+    if not text or text == "No text detected in the image":
+        return True
+    return not PromptBuilder.parse(text).question.endswith("?")
+
+def replay_clip(path, burst_size, interval, ocr_processor=None):
+    """Simulate a capture every `interval` frames, comparing the latest frame with the sharpest of the burst"""
+    import cv2
+    
+    cap = cv2.VideoCapture(path)
+    recent_frames = deque(maxlen=burst_size)
+    latest_scores, sharpest_scores = [], []
+    latest_failures = sharpest_failures = 0
+    index = 0
+    
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        recent_frames.append(frame)
+        index += 1
+        if index % interval or len(recent_frames) < burst_size:
+            continue
+        
+        best_frame, best_score = sharpest_frame(recent_frames)
+        latest_scores.append(focus_measure(frame))
+        sharpest_scores.append(best_score)
+        if ocr_processor:
+            latest_failures += is_ocr_failure(ocr_processor, frame)
+            sharpest_failures += is_ocr_failure(ocr_processor, best_frame)
+    cap.release()
+    
+    print(f"\nClip: {os.path.basename(path)} ({len(latest_scores)} simulated captures, burst of {burst_size})")
+    if latest_scores:
+        print(f"Median sharpness: latest {statistics.median(latest_scores):.0f} -> sharpest {statistics.median(sharpest_scores):.0f}")
+    if ocr_processor:
+        print(f"OCR failures:     latest {latest_failures} -> sharpest {sharpest_failures}")
+
+def main():
+    """Benchmark the focus metric cost and its effect on a recorded clip"""
+    parser = argparse.ArgumentParser(description="Benchmark sharpest-frame selection")
+    parser.add_argument("--clip", help="Recorded video of questions to replay")
+    parser.add_argument("--burst", type=int, default=5, help="Frames considered per capture")
+    parser.add_argument("--interval", type=int, default=30, help="Frames between simulated captures")
+    parser.add_argument("--ocr", action="store_true", help="Count OCR failures (uses Vision API calls)")
+    args = parser.parse_args()
+    
+    print("Focus metric cost per frame:")
+    for width, height in [(640, 480), (1280, 720), (1920, 1080)]:
+        cost = time_metric(width, height)
+        print(f"  {width}x{height}: {cost:.2f}ms ({args.burst} frames: {cost * args.burst:.2f}ms of a 33ms frame)")
+    
+    if args.clip:
+        ocr_processor = None
+        if args.ocr:
+            from config import Config
+            from ocr.ocr_processor import OCRProcessor
+            ocr_processor = OCRProcessor(Config().vision_client)
+        replay_clip(args.clip, args.burst, args.interval, ocr_processor)
+
+if __name__ == "__main__":
+    main()
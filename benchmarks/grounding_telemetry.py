@@ -0,0 +1,79 @@
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.prompt_builder import PromptBuilder
+from ai.grounding import needs_grounding
+from benchmarks.prompt_tokens import load_ocr_samples
+
+def load_result_records(root):
+    """Read every model result record from the recorded sessions under root"""
+    records = []
+    for log_path in sorted(glob.glob(os.path.join(root, "*", "session.jsonl"))):
+        with open(log_path, encoding="utf-8") as log_file:
+            for line in log_file:
+                record = json.loads(line)
+                if record["type"] == "result" and record.get("time"):
+                    records.append(record)
+    return records
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def main():
+    """Report how often questions skip search grounding and what that saves per provider"""
+    parser = argparse.ArgumentParser(description="Summarize grounded vs ungrounded model latency from recorded sessions")
+    parser.add_argument("--sessions", default="sessions", help="Session archive root")
+    args = parser.parse_args()
+    
+    # Classifier decisions on the recorded contest log
+    samples = load_ocr_samples()
+    print(f"Grounding decisions over {len(samples)} recorded questions")
+    print("-" * 70)
+    grounded_count = 0
+    for text in samples:
+        parsed = PromptBuilder.parse(text)
+        grounded, reason = needs_grounding(parsed)
+        grounded_count += grounded
+        print(f"{'search' if grounded else 'static':7s} {reason[:24]:24s} {parsed.question[:36]}")
+    print("-" * 70)
+    if samples:
+        print(f"{len(samples) - grounded_count} of {len(samples)} questions answered without search")
+    
+    # Latency by provider and grounding, from session telemetry
+    latencies = {}
+    for record in load_result_records(args.sessions):
+        if record.get("grounded") is None:
+            continue
+        model_name = record["model"]
+        if model_name.endswith("_grounded"):
+            model_name = model_name[:-len("_grounded")]
+        latencies.setdefault((model_name, record["grounded"]), []).append(record["time"])
+    
+    if not latencies:
+        print(f"\nNo grounding telemetry under {args.sessions}/ yet; run a recorded triple check first.")
+        return
+    
+    print(f"\n{'model':12s} {'search':>7s} {'calls':>6s} {'p50':>7s} {'p95':>7s}")
+    print("-" * 44)
+    for (model_name, grounded), times in sorted(latencies.items()):
+        print(f"{model_name:12s} {'on' if grounded else 'off':>7s} {len(times):6d} "
+              f"{statistics.median(times):6.2f}s {percentile(times, 0.95):6.2f}s")
+    
+    print()
+    for model_name in sorted({model_name for model_name, _ in latencies}):
+        grounded_times = latencies.get((model_name, True))
+        ungrounded_times = latencies.get((model_name, False))
+        if grounded_times and ungrounded_times:
+            saved = statistics.median(grounded_times) - statistics.median(ungrounded_times)
+            print(f"{model_name}: {saved:.2f}s saved at p50 by skipping search")
+
+if __name__ == "__main__":
+    main()
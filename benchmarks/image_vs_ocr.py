@@ -0,0 +1,55 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def main():
+    """Compare time-to-answer for OCR-then-text against sending the frame straight to a multimodal model"""
+    parser = argparse.ArgumentParser(description="Benchmark the direct image path against OCR + text")
+    parser.add_argument("images", nargs="+", help="Captured question images (JPEG)")
+    parser.add_argument("--model", choices=["gemini", "gpt4"], default="gemini", help="Model used for both paths")
+    parser.add_argument("--runs", type=int, default=3, help="Repetitions per image")
+    args = parser.parse_args()
+    
+    from config import Config
+    from ocr.ocr_processor import OCRProcessor
+    from ai.factory import create_ai_processors
+    from ai.prompt_builder import PromptBuilder
+    
+    config = Config()
+    ocr_processor = OCRProcessor(config.vision_client)
+    processor = create_ai_processors(config)[args.model]
+    
+    ocr_path_times, image_path_times = [], []
+    agreements = 0
+    for path in args.images:
+        with open(path, "rb") as image_file:
+            image_bytes = image_file.read()
+        
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            text = ocr_processor.extract_text_from_bytes(image_bytes)
+            text_answer = processor.process_text(text)["result"] if text else None
+            ocr_path_times.append(time.perf_counter() - start)
+            
+            start = time.perf_counter()
+            image_answer = processor.process_image(image_bytes)["result"]
+            image_path_times.append(time.perf_counter() - start)
+            
+            if text and PromptBuilder.resolve_answer(image_answer, PromptBuilder.parse(text)) == text_answer:
+                agreements += 1
+    
+    def summary(times):
+        times = sorted(times)
+        return f"mean {statistics.mean(times):.2f}s | p50 {times[len(times) // 2]:.2f}s | max {times[-1]:.2f}s"
+    
+    print("-" * 60)
+    print(f"OCR + text ({args.model}): {summary(ocr_path_times)}")
+    print(f"Image only ({args.model}): {summary(image_path_times)}")
+    print(f"Same answer: {agreements}/{len(image_path_times)}")
+
+if __name__ == "__main__":
+    main()
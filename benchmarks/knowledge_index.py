@@ -0,0 +1,78 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.prompt_builder import ParsedQuestion
+from knowledge.index import KnowledgeIndex
+
+VOCABULARY = [
+    "stock", "bond", "market", "crypto", "bitcoin", "ethereum", "index", "fund", "federal", "reserve",
+    "rate", "inflation", "dividend", "earnings", "exchange", "company", "founded", "year", "largest",
+    "percentage", "return", "token", "blockchain", "currency", "bank", "treasury", "yield", "option",
+    "futures", "commodity", "gold", "oil", "nasdaq", "dow", "ipo", "merger", "ceo", "chair", "tax",
+    "retirement", "account", "insurance", "loan", "credit", "debt", "asset", "capital", "price", "share"
+]
+
+def random_question(rng):
+    """Build a synthetic trivia-like question"""
+    words = rng.sample(VOCABULARY, rng.randint(6, 12))
+    return f"Which {' '.join(words)} {rng.randint(0, 10 ** 6)}?"
+
+def main():
+    """Measure index build time, cold open time and query latency at scale"""
+    parser = argparse.ArgumentParser(description="Benchmark the knowledge index")
+    parser.add_argument("--entries", type=int, default=100000, help="Synthetic entries to index")
+    parser.add_argument("--queries", type=int, default=1000, help="Lookups to time")
+    args = parser.parse_args()
+    
+    rng = random.Random(0)
+    questions = [random_question(rng) for _ in range(args.entries)]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "knowledge.db")
+        
+        build_start = time.perf_counter()
+        index = KnowledgeIndex(db_path, corpus_path=None)
+        index.add_many([(question, f"answer {i}") for i, question in enumerate(questions)])
+        build_time = time.perf_counter() - build_start
+        index.close()
+        
+        open_start = time.perf_counter()
+        index = KnowledgeIndex(db_path, corpus_path=None)
+        open_time = time.perf_counter() - open_start
+        
+        # Half the queries are known questions, half are unseen
+        latencies = []
+        hits = 0
+        for i in range(args.queries):
+            question = rng.choice(questions) if i % 2 == 0 else random_question(rng)
+            start = time.perf_counter()
+            hit = index.lookup(ParsedQuestion(question, [], question))
+            latencies.append(time.perf_counter() - start)
+            hits += 1 if hit else 0
+        
+        # Incremental update cost once the index is large
+        update_start = time.perf_counter()
+        index.add(random_question(rng), "new answer")
+        update_time = time.perf_counter() - update_start
+        index.close()
+        
+        size_mb = os.path.getsize(db_path) / (1024 * 1024)
+    
+    latencies.sort()
+    print("-" * 60)
+    print(f"Entries: {args.entries} ({size_mb:.1f} MB on disk)")
+    print(f"Build:   {build_time:.2f}s")
+    print(f"Open:    {open_time * 1000:.1f}ms")
+    print(f"Update:  {update_time * 1000:.1f}ms per answered question")
+    print(f"Lookup:  p50 {latencies[len(latencies) // 2] * 1000:.2f}ms | "
+          f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.2f}ms | "
+          f"max {latencies[-1] * 1000:.2f}ms ({hits}/{args.queries} confident hits)")
+
+if __name__ == "__main__":
+    main()
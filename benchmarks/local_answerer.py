@@ -0,0 +1,46 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.local import LocalProcessor
+from benchmarks.prompt_tokens import load_ocr_samples
+
+def main():
+    """Measure local answerer load time and per-question latency on the CPU"""
+    parser = argparse.ArgumentParser(description="Benchmark the local CPU answerer")
+    parser.add_argument("--model", default=os.getenv("LOCAL_MODEL_PATH"), help="Path to a GGUF model")
+    parser.add_argument("--threads", type=int, default=None, help="CPU threads (defaults to all cores)")
+    parser.add_argument("--runs", type=int, default=3, help="Passes over the recorded questions")
+    args = parser.parse_args()
+    
+    if not args.model:
+        print("Set LOCAL_MODEL_PATH or pass --model")
+        return 1
+    
+    load_start = time.perf_counter()
+    processor = LocalProcessor(args.model, n_threads=args.threads)
+    load_time = time.perf_counter() - load_start
+    
+    samples = load_ocr_samples()
+    latencies = []
+    for _ in range(args.runs):
+        for text in samples:
+            result = processor.process_text(text)
+            latencies.append(result["time"])
+    
+    latencies.sort()
+    print("-" * 60)
+    print(f"Model:   {os.path.basename(args.model)} ({args.threads or os.cpu_count()} threads, CPU only)")
+    print(f"Load:    {load_time:.2f}s")
+    print(f"Answers: {len(latencies)}")
+    print(f"Latency: mean {statistics.mean(latencies) * 1000:.0f}ms | "
+          f"p50 {latencies[len(latencies) // 2] * 1000:.0f}ms | "
+          f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.0f}ms")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
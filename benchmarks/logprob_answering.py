@@ -0,0 +1,123 @@
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.prompt_builder import PromptBuilder, OPTION_LETTERS
+from benchmarks.prompt_tokens import load_ocr_samples
+
+class MockChatHandler(BaseHTTPRequestHandler):
+    """Minimal OpenAI-style chat completions endpoint with per-token latency
+    
+    Always picks option B. Logprob requests get a top_logprobs list and must
+    carry a letter-only logit bias and max_tokens=1.
+    """
+    
+    first_token_latency = 0.25
+    token_latency = 0.03
+    free_text_tokens = 4
+    
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        
+        if request.get("logprobs"):
+            assert request["max_tokens"] == 1, "constrained requests must ask for a single token"
+            assert len(request["logit_bias"]) == request["top_logprobs"], "logit bias must cover exactly the options"
+            tokens = 1
+            letters = OPTION_LETTERS[:request["top_logprobs"]]
+            top_logprobs = [{"token": "B", "logprob": -0.06}]
+            top_logprobs += [{"token": letter, "logprob": -3.2 - i} for i, letter in enumerate(letters) if letter != "B"]
+            logprobs = {"content": [{"token": "B", "logprob": -0.06, "top_logprobs": top_logprobs}]}
+            content = "B"
+        else:
+            tokens = min(request.get("max_tokens", self.free_text_tokens), self.free_text_tokens)
+            logprobs = None
+            content = "B) answer"
+        
+        time.sleep(self.first_token_latency + self.token_latency * (tokens - 1))
+        
+        body = json.dumps({"choices": [{"message": {"content": content}, "logprobs": logprobs}]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+def start_mock_server():
+    """Serve the mock endpoint on a free localhost port and return (server, base URL)"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockChatHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+def confidence_reliability(root):
+    """Bucket recorded GPT-4 confidences and check how often each bucket matched the consensus"""
+    buckets = {}
+    for log_path in glob.glob(os.path.join(root, "*", "session.jsonl")):
+        confidences, consensus = {}, {}
+        with open(log_path, encoding="utf-8") as log_file:
+            for line in log_file:
+                record = json.loads(line)
+                if record["type"] == "result" and record["model"] == "gpt4" and record.get("confidence") is not None:
+                    confidences[record["question"]] = (record["confidence"], record["result"])
+                elif record["type"] == "consensus" and len(record["agreeing"]) >= 2:
+                    consensus[record["question"]] = record["answer"]
+        
+        for question_id, (confidence, answer) in confidences.items():
+            if question_id in consensus:
+                bucket = buckets.setdefault(min(int(confidence * 10), 9), [])
+                bucket.append(answer == consensus[question_id])
+    return buckets
+
+def main():
+    """Compare free-text and single-token logprob answering against a local mock endpoint"""
+    parser = argparse.ArgumentParser(description="Benchmark logprob single-token answering on a mock endpoint")
+    parser.add_argument("--runs", type=int, default=3, help="Repetitions per recorded question")
+    parser.add_argument("--sessions", default="sessions", help="Session archive root for the confidence reliability table")
+    args = parser.parse_args()
+    
+    from ai.gpt4 import GPT4Processor
+    
+    server, base_url = start_mock_server()
+    free_text = GPT4Processor("mock-key", base_url=base_url)
+    constrained = GPT4Processor("mock-key", constrained=True, base_url=base_url)
+    
+    samples = [text for text in load_ocr_samples() if PromptBuilder.parse(text).choices]
+    timings = {"free text": [], "single token": []}
+    for text in samples:
+        parsed = PromptBuilder.parse(text)
+        for _ in range(args.runs):
+            timings["free text"].append(free_text.process_text(text)["time"])
+            
+            result_data = constrained.process_text(text)
+            timings["single token"].append(result_data["time"])
+            assert result_data["result"] == parsed.choices[1], result_data
+            assert result_data["confidence"] > 0.9, result_data
+    server.shutdown()
+    
+    print(f"\nMock endpoint: {MockChatHandler.first_token_latency * 1000:.0f}ms first token + "
+          f"{MockChatHandler.token_latency * 1000:.0f}ms/token, {len(samples)} questions x {args.runs} runs")
+    print("-" * 50)
+    for mode, times in timings.items():
+        print(f"{mode:14s} p50 {statistics.median(times) * 1000:6.0f}ms   max {max(times) * 1000:6.0f}ms")
+    print("Single-token answers resolved to option text with confidence on every call")
+    
+    buckets = confidence_reliability(args.sessions)
+    if buckets:
+        print(f"\nGPT-4 confidence vs consensus ({args.sessions}/)")
+        print("-" * 50)
+        for bucket in sorted(buckets):
+            matches = buckets[bucket]
+            print(f"{bucket / 10:.1f}-{(bucket + 1) / 10:.1f}: {sum(matches) / len(matches):5.0%} agreed over {len(matches)} questions")
+
+if __name__ == "__main__":
+    main()
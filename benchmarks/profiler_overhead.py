@@ -0,0 +1,83 @@
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.profiling import FrameTimeMonitor, SamplingProfiler
+
+def busy_frame(work):
+    """Stand-in for a frame's render work: pure-Python arithmetic"""
+    total = 0
+    for i in range(work):
+        total += i * i
+    return total
+
+def background_worker(stop_event):
+    """Stand-in for a model thread parsing responses while the UI runs"""
+    while not stop_event.is_set():
+        busy_frame(2000)
+        time.sleep(0.001)
+
+def run_loop(frames, work, monitor=None):
+    """Run a synthetic UI loop and return seconds per frame"""
+    start = time.perf_counter()
+    for _ in range(frames):
+        if monitor:
+            monitor.start_frame()
+        busy_frame(work)
+        if monitor:
+            monitor.lap("render")
+            monitor.status_line()
+            monitor.lap("stats")
+    return (time.perf_counter() - start) / frames
+
+def main():
+    """Measure the cost of the frame-time monitor and the sampling profiler on a synthetic UI loop"""
+    parser = argparse.ArgumentParser(description="Frame monitor and sampling profiler overhead")
+    parser.add_argument("--frames", type=int, default=2000, help="Frames per measurement")
+    parser.add_argument("--work", type=int, default=20000, help="Loop iterations of work per frame")
+    parser.add_argument("--interval", type=float, default=0.005, help="Profiler sampling interval (s)")
+    args = parser.parse_args()
+    
+    stop_event = threading.Event()
+    workers = [threading.Thread(target=background_worker, args=(stop_event,), name=f"model-{i}", daemon=True) for i in range(3)]
+    for worker in workers:
+        worker.start()
+    
+    run_loop(args.frames // 10, args.work)
+    baseline = min(run_loop(args.frames, args.work) for _ in range(3))
+    monitor = FrameTimeMonitor()
+    monitored = min(run_loop(args.frames, args.work, monitor) for _ in range(3))
+    
+    profiler = SamplingProfiler(interval=args.interval)
+    profiler.start()
+    profiled = min(run_loop(args.frames, args.work, monitor) for _ in range(3))
+    profiler.stop()
+    stop_event.set()
+    
+    with tempfile.TemporaryDirectory() as output_dir:
+        path = profiler.dump(os.path.join(output_dir, "profile.collapsed"))
+        with open(path, encoding="utf-8") as profile_file:
+            stacks = profile_file.read().splitlines()
+    
+    print(f"Synthetic UI loop, {args.frames} frames x 3 runs, 3 background threads")
+    print("-" * 60)
+    print(f"baseline              {baseline * 1000:7.3f}ms/frame")
+    print(f"+ frame monitor       {monitored * 1000:7.3f}ms/frame ({(monitored - baseline) * 1e6:+.0f}us)")
+    print(f"+ sampling profiler   {profiled * 1000:7.3f}ms/frame ({(profiled - monitored) * 1e6:+.0f}us more), "
+          f"every {args.interval * 1000:.0f}ms")
+    print(f"{profiler.samples} samples at {profiler.sample_time / profiler.samples * 1e6:.0f}us each "
+          f"({profiler.overhead():.1%} of wall time), {len(stacks)} distinct stacks; hottest:")
+    for line in sorted(stacks, key=lambda line: int(line.rsplit(" ", 1)[1]), reverse=True)[:4]:
+        stack, count = line.rsplit(" ", 1)
+        frames = stack.split(";")
+        print(f"  {count:>6s}  {frames[0]} ... {frames[-1]}")
+    print()
+    print(monitor.report())
+
+if __name__ == "__main__":
+    main()
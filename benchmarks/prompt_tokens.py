@@ -0,0 +1,61 @@
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.prompt_builder import PromptBuilder
+
+LOG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "winning_output.txt")
+
+# The verbose prompts every processor sent before the shared prompt builder
+LEGACY_SYSTEM_PROMPT = "You are an assistant and finance expert that analyzes multiple choice questions and determines the correct answer."
+LEGACY_USER_PROMPT = "This image contains a multiple choice question. Using the latest information tell me which answer is correct. Only tell me the correct answer, no explanation needed.\n\n{text}"
+LEGACY_MAX_OUTPUT_TOKENS = 100
+
+def load_ocr_samples(path=LOG_PATH):
+    """Pull every OCR block out of a recorded contest log"""
+    with open(path, encoding="utf-8") as log_file:
+        content = log_file.read()
+    
+    pattern = re.compile(r"Extracted text \([\d.]+s\):\n-{40}\n(.*?)\n-{40}", re.DOTALL)
+    return pattern.findall(content)
+
+def get_token_counter():
+    """Return a token counting function, using tiktoken when it is installed"""
+    try:
+        import tiktoken
+        encoding = tiktoken.get_encoding("cl100k_base")
+        return lambda text: len(encoding.encode(text)), "tiktoken cl100k_base"
+    except ImportError:
+        # Roughly four characters per token for English text
+        return lambda text: max(1, round(len(text) / 4)), "estimate (chars / 4)"
+
+def main():
+    """Compare input and output token budgets for the legacy and compact prompts"""
+    samples = load_ocr_samples()
+    count_tokens, method = get_token_counter()
+    builder = PromptBuilder()
+    
+    legacy_total = 0
+    compact_total = 0
+    
+    print(f"Token counts over {len(samples)} recorded questions ({method})")
+    print("-" * 60)
+    
+    for text in samples:
+        legacy = count_tokens(LEGACY_SYSTEM_PROMPT) + count_tokens(LEGACY_USER_PROMPT.format(text=text))
+        parsed = builder.parse(text)
+        compact = count_tokens(builder.system_prompt) + count_tokens(builder.build_user_prompt(parsed))
+        legacy_total += legacy
+        compact_total += compact
+        print(f"{legacy:5d} -> {compact:5d}  {parsed.question[:45]}")
+    
+    print("-" * 60)
+    if samples:
+        print(f"Input tokens per call:  {legacy_total / len(samples):.1f} -> {compact_total / len(samples):.1f} "
+              f"({100 * (1 - compact_total / legacy_total):.0f}% fewer)")
+    print(f"Output token cap:       {LEGACY_MAX_OUTPUT_TOKENS} (GPT-4 only) -> {builder.max_output_tokens} (all providers)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+import argparse
+import base64
+import json
+import multiprocessing
+import os
+import queue
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from core.frame_ring import SharedFrameRing
+from core.pipeline import MultiProcessPipeline, read_burst
+
+FRAME_TIME = 1 / 30
+FRAME_SHAPE = (720, 1280, 3)
+
+def heavy_work(stop_event):
+    """Stand-in for encode/OCR/model fan-out: JSON and base64 churn that holds the GIL"""
+    payload = {"choices": [{"message": {"content": "x" * 2000}} for _ in range(200)]}
+    blob = os.urandom(1024 * 1024)
+    while not stop_event.is_set():
+        json.loads(json.dumps(payload))
+        base64.b64encode(blob)
+
+def synthetic_capture(ring_spec, sequence, fps, stop_event):
+    """Write frames into the ring at camera rate, as the capture process does"""
+    ring = SharedFrameRing.attach(ring_spec, sequence)
+    frame = np.zeros(ring.shape, dtype=np.uint8)
+    next_at = time.perf_counter()
+    try:
+        while not stop_event.is_set():
+            frame[...] = ring.latest() % 256
+            ring.write(frame)
+            next_at += 1 / fps
+            time.sleep(max(0.0, next_at - time.perf_counter()))
+    finally:
+        ring.close()
+
+def burst_reader(ring_spec, sequence, request_queue, stats_queue, max_delay, stop_event):
+    """Read each requested burst the way the OCR process does, after a random wait for it to be free"""
+    ring = SharedFrameRing.attach(ring_spec, sequence)
+    try:
+        while not stop_event.is_set():
+            try:
+                frame_sequence = request_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            time.sleep(random.uniform(0, max_delay))
+            
+            behind = ring.latest() - frame_sequence
+            burst = read_burst(ring, frame_sequence)
+            stats_queue.put((behind, len(burst)))
+    finally:
+        ring.close()
+
+def render_work(frame):
+    """Stand-in for the per-frame overlay drawing done in the UI loop"""
+    total = float(frame[::8, ::8].mean())
+    for i in range(20000):
+        total += i * i
+    return total
+
+def run_ui_loop(duration, latest_frame, request_capture, interval):
+    """Run a 30 FPS loop on the newest frame, asking for a capture every interval seconds"""
+    frame_times = []
+    end_time = time.perf_counter() + duration
+    last = next_request = time.perf_counter()
+    while last < end_time:
+        frame_sequence, frame = latest_frame()
+        if frame is not None:
+            render_work(frame)
+        if last >= next_request:
+            request_capture(frame_sequence)
+            next_request = last + interval
+        
+        # Sleep out the rest of the frame like cv2.waitKey would
+        remaining = FRAME_TIME - (time.perf_counter() - last)
+        if remaining > 0:
+            time.sleep(remaining)
+        
+        now = time.perf_counter()
+        frame_times.append(now - last)
+        last = now
+    return frame_times
+
+def measure_ring(slots, mode, args):
+    """UI frame times and burst sizes for a SharedFrameRing fed by a synthetic camera
+    
+    mode puts the heavy work in threads of the UI process (as the threaded
+    triple check mode does), in separate processes (as MultiProcessPipeline
+    does), or nowhere ("idle").
+    """
+    context = multiprocessing.get_context("spawn")
+    stop_event = context.Event()
+    request_queue = context.Queue()
+    stats_queue = context.Queue()
+    sequence = SharedFrameRing.create_sequence(context)
+    ring = SharedFrameRing(FRAME_SHAPE, sequence, slots=slots)
+    
+    workers = [
+        context.Process(target=synthetic_capture, args=(ring.spec(), sequence, args.fps, stop_event), daemon=True),
+        context.Process(target=burst_reader, args=(ring.spec(), sequence, request_queue, stats_queue, args.delay, stop_event), daemon=True)
+    ]
+    if mode == "thread":
+        workers += [threading.Thread(target=heavy_work, args=(stop_event,), daemon=True) for _ in range(args.workers)]
+    elif mode == "process":
+        workers += [context.Process(target=heavy_work, args=(stop_event,), daemon=True) for _ in range(args.workers)]
+    for worker in workers:
+        worker.start()
+    time.sleep(1.0)  # Let spawned workers get going
+    
+    def latest_frame():
+        frame_sequence = ring.latest()
+        return frame_sequence, ring.read(frame_sequence)
+    
+    try:
+        frame_times = run_ui_loop(args.duration, latest_frame, request_queue.put, args.interval)
+        time.sleep(args.delay + 0.2)  # Let the last burst be read
+    finally:
+        stop_event.set()
+        for worker in workers:
+            worker.join()
+        ring.close()
+    
+    bursts = []
+    while not stats_queue.empty():
+        bursts.append(stats_queue.get())
+    return frame_times, bursts
+
+def measure_pipeline(args):
+    """UI frame times and failed captures for the full MultiProcessPipeline on a real camera"""
+    pipeline = MultiProcessPipeline(args.camera)
+    pipeline.start()
+    messages = []
+    
+    def latest_frame():
+        messages.extend(pipeline.poll_messages())
+        return pipeline.latest_frame()
+    
+    try:
+        frame_times = run_ui_loop(args.duration, latest_frame, lambda frame_sequence: pipeline.request_capture(frame_sequence, 10.0), args.interval)
+    finally:
+        pipeline.stop()
+    return frame_times, messages
+
+def frame_time_columns(frame_times):
+    """Format mean, stdev, p99, max and missed-frame count"""
+    frame_times = sorted(frame_times)
+    missed = sum(1 for frame_time in frame_times if frame_time > 1.5 * FRAME_TIME)
+    return (f"{statistics.mean(frame_times) * 1000:>7.1f}ms"
+            f"{statistics.stdev(frame_times) * 1000:>7.1f}ms"
+            f"{frame_times[int(len(frame_times) * 0.99)] * 1000:>7.1f}ms"
+            f"{frame_times[-1] * 1000:>7.1f}ms"
+            f"{missed:>8}")
+
+def main():
+    """Compare UI frame-time jitter with heavy work on threads vs processes, then frame ring sizes"""
+    parser = argparse.ArgumentParser(description="Benchmark the multi-process pipeline's UI jitter and frame ring")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per configuration")
+    parser.add_argument("--slots", type=int, nargs="+", default=[4, 16], help="Ring sizes to compare; the first table uses the last")
+    parser.add_argument("--fps", type=float, default=60.0, help="Synthetic camera frame rate")
+    parser.add_argument("--delay", type=float, default=0.3, help="Longest wait before a burst is read, seconds")
+    parser.add_argument("--interval", type=float, default=0.25, help="Seconds between capture requests")
+    parser.add_argument("--workers", type=int, default=2, help="Concurrent heavy workers")
+    parser.add_argument("--camera", type=int, help="Run the full pipeline on this camera instead (needs API keys)")
+    args = parser.parse_args()
+    
+    if args.camera is not None:
+        frame_times, messages = measure_pipeline(args)
+        print(f"{'mean':>9}{'stdev':>9}{'p99':>9}{'max':>9}{'missed':>8}")
+        print(frame_time_columns(frame_times))
+        failed = [message for message in messages if message[0] == "failed"]
+        print(f"Captures failed: {len(failed)}")
+        return
+    
+    print(f"{FRAME_SHAPE[1]}x{FRAME_SHAPE[0]} frames at {args.fps:g} FPS, {args.workers} heavy workers")
+    print(f"{'mode':<9}{'mean':>9}{'stdev':>9}{'p99':>9}{'max':>9}{'missed':>8}")
+    for mode in ("idle", "thread", "process"):
+        frame_times, _ = measure_ring(args.slots[-1], mode, args)
+        print(f"{mode:<9}{frame_time_columns(frame_times)}")
+    
+    print(f"\nRing sizes, heavy work in processes, bursts read up to {args.delay * 1000:.0f}ms after the request")
+    print(f"{'slots':<7}{'mean':>9}{'stdev':>9}{'p99':>9}{'max':>9}{'missed':>8}{'bursts':>8}{'avg size':>10}{'fallback':>10}")
+    for slots in args.slots:
+        frame_times, bursts = measure_ring(slots, "process", args)
+        # The requested frame was gone once the writer was a full ring (less the guard slot) ahead
+        fallback = sum(1 for behind, _ in bursts if behind >= slots - 1)
+        average_size = statistics.mean(size for _, size in bursts) if bursts else 0.0
+        print(f"{slots:<7}{frame_time_columns(frame_times)}{len(bursts):>8}{average_size:>10.2f}{fallback:>10}")
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,9 @@ import time
 import os
 import platform
 import re
+from collections import deque
+from camera.focus import sharpest_frame
+from camera.profiles import CaptureProfile, CaptureProfileStore
 
 class CameraManager:
     """Manages camera operations like listing, capturing, and displaying video feed"""
@@ -66,22 +69,33 @@ class CameraManager:
         
         return available_cameras
     
-    def __init__(self, camera_index=0, camera_name=None):
+    def __init__(self, camera_index=0, camera_name=None, profile_store=None, burst_size=5):
         self.camera_index = camera_index
         self.camera_name = camera_name if camera_name else f"Camera {camera_index}"
+        self.profile_store = profile_store if profile_store else CaptureProfileStore()
         self.cap = None
+        
+        # Last few frames read, so a capture can pick the sharpest instead of the latest
+        self.recent_frames = deque(maxlen=burst_size)
+    
+    def get_profile(self):
+        """Return the tuned capture profile for this camera, or a default one that only shrinks the driver buffer"""
+        profile = self.profile_store.get(self.camera_index)
+        return profile if profile else CaptureProfile()
     
     def open(self):
         """Open the camera"""
         self.cap = cv2.VideoCapture(self.camera_index)
         if not self.cap.isOpened():
             raise RuntimeError(f"Could not open camera with index {self.camera_index}")
+        self.get_profile().apply(self.cap)
         # Wait a moment for the camera to initialize
         time.sleep(1)
         return self.cap
     
     def release(self):
         """Release camera resources"""
+        self.recent_frames.clear()
         if self.cap and self.cap.isOpened():
             self.cap.release()
             cv2.destroyAllWindows()
@@ -101,6 +115,7 @@ class CameraManager:
             if not ret:
                 print("Error: Could not read frame")
                 break
+            self.recent_frames.append(frame)
 
             cv2.imshow('Capture MCQ (Press SPACE to capture)', frame)
             
@@ -109,7 +124,7 @@ class CameraManager:
             
             # Space key to capture
             if key == 32:  # ASCII for space
-                cv2.imwrite(temp_filename, frame)
+                cv2.imwrite(temp_filename, self.sharpest_recent_frame())
                 print("Image captured successfully")
                 break
                 
@@ -131,4 +146,22 @@ class CameraManager:
         ret, frame = self.cap.read()
         if not ret:
             raise RuntimeError("Could not read frame from camera")
+        self.recent_frames.append(frame)
+        return frame
+    
+    @staticmethod
+    def encode_frame(frame, max_width=1280, quality=85):
+        """Downscale and JPEG-encode a frame for upload, returning the bytes"""
+        height, width = frame.shape[:2]
+        if width > max_width:
+            frame = cv2.resize(frame, (max_width, int(height * max_width / width)), interpolation=cv2.INTER_AREA)
+        
+        ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not ok:
+            raise RuntimeError("Could not encode frame")
+        return encoded.tobytes()
+    
+    def sharpest_recent_frame(self):
+        """Return the least motion-blurred of the recently read frames"""
+        frame, score = sharpest_frame(self.recent_frames)
         return frame 
\ No newline at end of file
@@ -0,0 +1,32 @@
+import numpy as np
+
+def focus_measure(frame, analysis_width=320):
+    """Variance of the Laplacian over a downscaled central region; higher means sharper
+    
+    Downscaling is plain strided slicing and the Laplacian is built from shifted
+    views, so the whole measure is a handful of vectorized NumPy operations.
+    """
+    height, width = frame.shape[:2]
+    roi = frame[height // 4:3 * height // 4, width // 4:3 * width // 4]
+    
+    step = max(1, roi.shape[1] // analysis_width)
+    roi = roi[::step, ::step]
+    
+    # Green channel is a close, cheap stand-in for luminance
+    gray = (roi[..., 1] if roi.ndim == 3 else roi).astype(np.float32)
+    
+    laplacian = (
+        gray[1:-1, :-2] + gray[1:-1, 2:] + gray[:-2, 1:-1] + gray[2:, 1:-1]
+        - 4 * gray[1:-1, 1:-1]
+    )
+    return float(laplacian.var())
+
+def sharpest_frame(frames):
+    """Return (frame, score) for the sharpest of the given frames"""
+    best_frame = None
+    best_score = -1.0
+    for frame in frames:
+        score = focus_measure(frame)
+        if score > best_score:
+            best_frame, best_score = frame, score
+    return best_frame, best_score
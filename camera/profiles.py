@@ -0,0 +1,187 @@
+import json
+import os
+import time
+import cv2
+
+class CaptureProfile:
+    """Camera capture settings: resolution, frame rate, codec, driver buffer size and exposure
+    
+    Any setting left as None keeps the driver default.
+    """
+    
+    def __init__(self, width=None, height=None, fps=None, fourcc=None, buffer_size=1, exposure=None):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.fourcc = fourcc
+        self.buffer_size = buffer_size
+        self.exposure = exposure
+    
+    def to_dict(self):
+        """Return the profile as a JSON-serializable dict"""
+        return dict(self.__dict__)
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Create a profile from a dict produced by to_dict"""
+        return cls(**data)
+    
+    def apply(self, cap):
+        """Apply the profile to an open cv2.VideoCapture"""
+        # The codec has to be set before the resolution on most V4L2/DirectShow drivers
+        if self.fourcc:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc))
+        if self.width and self.height:
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        if self.fps:
+            cap.set(cv2.CAP_PROP_FPS, self.fps)
+        if self.buffer_size:
+            # Keeps reads on the newest frame instead of several frames behind
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+        if self.exposure is not None:
+            cap.set(cv2.CAP_PROP_EXPOSURE, self.exposure)
+    
+    def __str__(self):
+        resolution = f"{self.width}x{self.height}" if self.width else "default"
+        return f"{resolution} @ {self.fps or 'default'} FPS, {self.fourcc or 'default codec'}, buffer {self.buffer_size}"
+
+class CaptureProfileStore:
+    """Persists the chosen capture profile for each camera index"""
+    
+    def __init__(self, path="camera_profiles.json"):
+        self.path = path
+    
+    def _load(self):
+        """Load all stored profiles"""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as profiles_file:
+                return json.load(profiles_file)
+        except (OSError, ValueError) as e:
+            print(f"Could not load camera profiles: {e}")
+            return {}
+    
+    def get(self, camera_index):
+        """Return the stored profile for a camera, or None"""
+        data = self._load().get(str(camera_index))
+        return CaptureProfile.from_dict(data) if data else None
+    
+    def save(self, camera_index, profile):
+        """Store the profile for a camera"""
+        profiles = self._load()
+        profiles[str(camera_index)] = profile.to_dict()
+        with open(self.path, "w") as profiles_file:
+            json.dump(profiles, profiles_file, indent=2)
+
+# Common webcam modes, best first when they measure equally well
+CANDIDATE_PROFILES = [
+    CaptureProfile(1920, 1080, 30, "MJPG"),
+    CaptureProfile(1280, 720, 60, "MJPG"),
+    CaptureProfile(1280, 720, 30, "MJPG"),
+    CaptureProfile(1280, 720, 30, "YUYV"),
+    CaptureProfile(640, 480, 30, "MJPG"),
+    CaptureProfile(640, 480, 30, "YUYV")
+]
+
+def _legibility(frame, analysis_width=640):
+    """Sharpness of the central region as a proxy for OCR legibility (Laplacian variance)
+    
+    The region is resized to a common width first so modes are compared on
+    blur and compression artifacts rather than on raw pixel count.
+    """
+    height, width = frame.shape[:2]
+    roi = frame[height // 4:3 * height // 4, width // 4:3 * width // 4]
+    scale = analysis_width / roi.shape[1]
+    roi = cv2.resize(roi, (analysis_width, int(roi.shape[0] * scale)), interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+    return cv2.Laplacian(gray, cv2.CV_64F).var()
+
+def measure_profile(camera_index, profile, ocr_processor=None, frames=45, warmup=10):
+    """Open a camera with a profile and measure what it actually delivers
+    
+    With an OCR processor, one frame is also run through OCR and the number of
+    characters read is recorded. Returns None if the camera could not be opened
+    or silently fell back to a different resolution.
+    """
+    cap = cv2.VideoCapture(camera_index)
+    if not cap.isOpened():
+        return None
+    
+    try:
+        profile.apply(cap)
+        actual_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        actual_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        if profile.width and (actual_width, actual_height) != (profile.width, profile.height):
+            return None
+        
+        for _ in range(warmup):
+            cap.read()
+        
+        read_times = []
+        legibility = []
+        start_time = time.perf_counter()
+        for _ in range(frames):
+            read_start = time.perf_counter()
+            ret, frame = cap.read()
+            read_times.append(time.perf_counter() - read_start)
+            if not ret:
+                return None
+            legibility.append(_legibility(frame))
+        elapsed = time.perf_counter() - start_time
+        
+        ocr_chars = None
+        if ocr_processor:
+            ok, encoded = cv2.imencode(".jpg", frame)
+            text = ocr_processor.extract_text_from_bytes(encoded.tobytes()) if ok else None
+            ocr_chars = len("".join(text.split())) if text and text != "No text detected in the image" else 0
+        
+        return {
+            "profile": profile,
+            "fps": frames / elapsed,
+            "read_ms": 1000 * sum(read_times) / len(read_times),
+            "legibility": sorted(legibility)[len(legibility) // 2],
+            "ocr_chars": ocr_chars
+        }
+    finally:
+        cap.release()
+
+def auto_tune(camera_index, candidates=CANDIDATE_PROFILES, ocr_processor=None, min_fps=24):
+    """Measure every candidate mode and return (best profile, measurements)
+    
+    Among modes that sustain min_fps, the one OCR reads the most characters from
+    (when an OCR processor is given) and then the sharpest wins; if none are
+    fast enough, the fastest mode wins.
+    """
+    measurements = []
+    for profile in candidates:
+        print(f"Measuring {profile}...")
+        measurement = measure_profile(camera_index, profile, ocr_processor)
+        if measurement:
+            measurements.append(measurement)
+        else:
+            print("  not supported")
+    
+    if not measurements:
+        return None, measurements
+    
+    fast_enough = [m for m in measurements if m["fps"] >= min_fps]
+    if fast_enough:
+        best = max(fast_enough, key=lambda m: (m["ocr_chars"] or 0, m["legibility"], -m["read_ms"]))
+    else:
+        best = max(measurements, key=lambda m: m["fps"])
+    return best["profile"], measurements
+
+def print_report(measurements, best_profile):
+    """Print a comparison table of measured profiles"""
+    print("\n" + "=" * 82)
+    print(f"{'Profile':<40}{'FPS':>8}{'Read':>10}{'Sharpness':>12}{'OCR chars':>12}")
+    print("-" * 82)
+    for m in measurements:
+        marker = " *" if m["profile"] is best_profile else ""
+        ocr_chars = "-" if m["ocr_chars"] is None else m["ocr_chars"]
+        print(f"{str(m['profile']):<40}{m['fps']:>8.1f}{m['read_ms']:>8.1f}ms{m['legibility']:>12.0f}{ocr_chars:>12}{marker}")
+    print("=" * 82)
+    if best_profile:
+        print(f"Selected: {best_profile}")
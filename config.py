@@ -14,6 +14,23 @@ class Config:
         self.google_credentials_path = os.getenv("GOOGLE_CREDENTIALS_PATH")
         self.google_api_key = os.getenv("GEMINI_API_KEY")
         
+        # Optional: path to a GGUF model for the local CPU answerer
+        self.local_model_path = os.getenv("LOCAL_MODEL_PATH")
+        
+        # Single-token GPT-4 answers with logprob confidence (set GPT4_CONSTRAINED=0 for free text)
+        self.gpt4_constrained = os.getenv("GPT4_CONSTRAINED", "1") != "0"
+        self.gpt4_confidence_temperature = float(os.getenv("GPT4_CONFIDENCE_TEMPERATURE", "1.0"))
+        
+        # Override to point GPT-4 at a compatible or mock endpoint
+        self.openai_base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+        
+        # Seconds per question when the on-screen timer can't be read, and the margin left to tap the answer
+        self.question_budget = float(os.getenv("QUESTION_BUDGET", "10"))
+        self.deadline_margin = float(os.getenv("DEADLINE_MARGIN", "1.0"))
+        
+        # Session recording to sessions/ (set RECORD_SESSIONS=0 to turn off)
+        self.record_sessions = os.getenv("RECORD_SESSIONS", "1") != "0"
+        
         self._validate_credentials()
         
         self.vision_client = self._init_vision_client()
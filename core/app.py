@@ -1,8 +1,17 @@
 import os
 import time
 import threading
+import functools
 import concurrent.futures
 import cv2
+from core.consensus import ConsensusTracker
+from ai.prompt_builder import PromptBuilder
+from ai.grounding import needs_grounding
+from knowledge.index import KnowledgeIndex
+from core.recorder import SessionRecorder, load_session
+from core.result_state import ResultState
+from core.deadline import Deadline, DeadlineScheduler, LatencyTracker, read_countdown
+from core.profiling import FrameTimeMonitor, SamplingProfiler
 
 class RobbinHoodApp:
     """Main application class coordinating the RobbinHood app workflow"""
@@ -13,16 +22,24 @@ class RobbinHoodApp:
         self.ocr_processor = ocr_processor
         self.display_manager = display_manager
         
-        from ai.perplexity import PerplexityProcessor
-        from ai.gpt4 import GPT4Processor
-        from ai.gemini import GeminiProcessor
+        from ai.factory import create_ai_processors
+        self.ai_processors = create_ai_processors(config)
         
-        self.ai_processors = {
-            "gpt4": GPT4Processor(config.openai_api_key),
-            "sonar_pro": PerplexityProcessor(config.perplexity_api_key, model="sonar-pro"),
-            "sonar": PerplexityProcessor(config.perplexity_api_key, model="sonar"),
-            "gemini": GeminiProcessor(config.google_api_key,model="gemini-2.0-flash")
+        # Multimodal voters that answer straight from the captured frame
+        self.image_processors = {
+            f"{model_name}_image": processor
+            for model_name, processor in self.ai_processors.items()
+            if processor.supports_images
         }
+        
+        # Weighted consensus; the local model starts at half weight until it earns more
+        self.consensus = ConsensusTracker(prior_weights={"local": 0.5})
+        
+        # Local retrieval index of curated and previously answered questions
+        self.knowledge_index = KnowledgeIndex()
+        
+        # Per-model latency history, so the deadline scheduler knows what still fits
+        self.latency = LatencyTracker()
     
     def run(self):
         """Run the main application loop"""
@@ -32,9 +49,13 @@ class RobbinHoodApp:
             print("\nOptions:")
             print("1. Sonar Pro (less credits used)")
             print("2. Triple check mode (uses more api credits be careful)")
-            print("3. Change camera")
-            print("4. Exit")
-            choice = input("Enter your choice (1-4): ")
+            print("3. Triple check mode, multi-process (smoother UI while models run)")
+            print("4. Auto triple check (reads each question as it appears, more OCR calls)")
+            print("5. Change camera")
+            print("6. Tune camera capture profile")
+            print("7. Replay a recorded session")
+            print("8. Exit")
+            choice = input("Enter your choice (1-8): ")
             
             if choice == '1':
                 self.continuous_capture_and_process()
@@ -43,9 +64,21 @@ class RobbinHoodApp:
                 self.continuous_triple_check()
                 
             elif choice == '3':
-                self.change_camera()
+                self.continuous_triple_check_multiprocess()
                 
             elif choice == '4':
+                self.auto_triple_check()
+                
+            elif choice == '5':
+                self.change_camera()
+                
+            elif choice == '6':
+                self.tune_camera()
+                
+            elif choice == '7':
+                self.replay_session()
+                
+            elif choice == '8':
                 print("Exiting...")
                 break
             else:
@@ -75,6 +108,27 @@ class RobbinHoodApp:
         except ValueError:
             print("Invalid input. No changes made.")
     
+    def tune_camera(self):
+        """Measure the camera's capture modes and store the best one"""
+        from camera.profiles import auto_tune, print_report
+        
+        print(f"Tuning {self.camera_manager.camera_name}. Point the camera at a question for the OCR check.")
+        use_ocr = input("Run OCR on each mode? Uses Vision API calls (y/N): ").strip().lower() == "y"
+        
+        # Tuning opens the device itself
+        self.camera_manager.release()
+        best_profile, measurements = auto_tune(
+            self.camera_manager.camera_index,
+            ocr_processor=self.ocr_processor if use_ocr else None
+        )
+        print_report(measurements, best_profile)
+        
+        if best_profile:
+            self.camera_manager.profile_store.save(self.camera_manager.camera_index, best_profile)
+            print("Profile saved. It will be used next time the camera opens.")
+        else:
+            print("No capture mode could be measured. Keeping the current settings.")
+    
     def continuous_capture_and_process(self):
         """Continuously capture and process images until ESC is pressed"""
         print("Starting continuous capture mode. Press SPACE to capture an image, ESC to return to menu.")
@@ -89,6 +143,8 @@ class RobbinHoodApp:
         api_time = None
         total_time = None
         
+        recorder = SessionRecorder(enabled=self.config.record_sessions)
+        
         try:
             while True:
                 frame = self.camera_manager.read_frame()
@@ -176,20 +232,26 @@ class RobbinHoodApp:
                     
                 # Space key to capture and process
                 if key == 32 and not is_processing:  # ASCII for space
-                    # Save the current frame
+                    # Save the sharpest of the last few frames
                     temp_filename = "temp_capture.jpg"
-                    cv2.imwrite(temp_filename, frame)
+                    captured_frame = self.camera_manager.sharpest_recent_frame()
+                    cv2.imwrite(temp_filename, captured_frame)
                     print("\nImage captured, processing...")
                     
+                    question_id = recorder.new_question()
+                    recorder.record_frame(question_id, frame=captured_frame)
+                    
                     # Set processing flag and start time
                     is_processing = True
                     processing_start_time = time.time()
+                    deadline = Deadline(self.config.question_budget, self.config.deadline_margin)
                     
                     # Two-step process: OCR then Perplexity
                     ocr_start_time = time.time()
                     extracted_text = self.ocr_processor.extract_text(temp_filename)
                     ocr_end_time = time.time()
                     ocr_time = ocr_end_time - ocr_start_time
+                    recorder.record_ocr(question_id, extracted_text, ocr_time)
                     
                     if extracted_text:
                         print(f"\nExtracted text ({ocr_time:.2f}s):")
@@ -197,11 +259,22 @@ class RobbinHoodApp:
                         print(extracted_text)
                         print("-" * 40)
                         
-                        # Process with Perplexity
+                        # Process with Perplexity, searching only when the question needs fresh facts
+                        grounded, reason = needs_grounding(PromptBuilder.parse(extracted_text))
+                        print(f"Search grounding: {'on' if grounded else 'off'} ({reason})")
+                        
+                        # Give up on the request once the on-screen timer (or the configured budget) runs out
+                        countdown = read_countdown(extracted_text)
+                        if countdown is not None:
+                            deadline.set_countdown(countdown)
                         perplexity_start_time = time.time()
-                        perplexity_result = self.ai_processors["sonar_pro"].process_text(extracted_text)
+                        try:
+                            perplexity_result = self.ai_processors["sonar_pro"].process_text(extracted_text, grounded, timeout=max(0.1, deadline.remaining()))
+                        except Exception as e:
+                            perplexity_result = {"result": f"Failed: {e}", "time": time.time() - perplexity_start_time}
                         perplexity_end_time = time.time()
                         api_time = perplexity_end_time - perplexity_start_time
+                        recorder.record_result(question_id, "sonar_pro", perplexity_result)
                         
                         # Update last result and reset processing flag
                         last_result = perplexity_result["result"]
@@ -232,151 +305,178 @@ class RobbinHoodApp:
         
         finally:
             # Release resources
+            recorder.close()
             self.camera_manager.release()
     
     def continuous_triple_check(self):
         """Continuously capture images and perform triple-check analysis until ESC is pressed"""
-        print("Starting continuous triple-check mode. Press SPACE to capture an image, ESC to return to menu.")
+        print("Starting continuous triple-check mode. Press SPACE to capture an image, P to toggle the profiler, ESC to return to menu.")
         
         self.camera_manager.open()
         
-        # Variables to store processing status and results
-        is_processing = False
-        has_results = False  # Flag to track if we have results to display
-        processing_start_time = 0
-        current_question = None
+        # Question, results and processing flag, published by the worker as immutable snapshots
+        state = ResultState(list(self.ai_processors) + list(self.image_processors))
         
-        # Results dictionary (will be updated during processing)
-        results = {
-            "gpt4": {"result": None, "time": None},
-            "sonar_pro": {"result": None, "time": None},
-            "sonar": {"result": None, "time": None}
-        }
-        
-        # Flag to track if processing is complete
-        processing_complete = True
+        recorder = SessionRecorder(enabled=self.config.record_sessions)
+        monitor, profiler = self.frame_monitor(), SamplingProfiler()
         
         try:
             while True:
+                monitor.start_frame()
                 frame = self.camera_manager.read_frame()
+                monitor.lap("camera")
                 
-                # Render the UI with current state
-                display_frame = self.display_manager.renderer.render_result_overlay(
-                    frame, current_question, results, is_processing)
+                # Render the UI with current state; the overlay is only redrawn when the state changes
+                snapshot = state.snapshot()
+                display_frame = self.display_manager.renderer.render_snapshot_overlay(frame, snapshot)
+                self.display_manager.renderer.render_frame_stats(display_frame, monitor.status_line())
+                monitor.lap("render")
                 
                 cv2.imshow('Continuous Triple Check Mode', display_frame)
+                monitor.lap("imshow")
+                monitor.frame_shown()
                 
                 # Wait for key press
                 key = cv2.waitKey(1) & 0xFF
+                monitor.lap("waitkey")
                 
                 # ESC key to exit
                 if key == 27:  # ASCII for escape
                     print("Returning to menu...")
                     break
                 
+                if key == ord('p'):
+                    profiler.toggle(self.profile_dir(recorder))
+                
                 # Space key to capture and process (only if not already processing)
-                if key == 32 and not is_processing:  # ASCII for space
-                    # Set processing flags
-                    is_processing = True
-                    has_results = False  # Clear previous results flag
-                    processing_start_time = time.time()
-                    processing_complete = False
-                    current_question = None
+                if key == 32 and not snapshot.is_processing:  # ASCII for space
+                    # Reset question and results for the new capture
+                    state.start()
                     
-                    # Reset results for new capture
-                    for key in results:
-                        results[key] = {"result": None, "time": None}
+                    # The clock starts at capture; the on-screen timer replaces the configured budget once read
+                    deadline = Deadline(self.config.question_budget, self.config.deadline_margin)
+                    scheduler = DeadlineScheduler(deadline, self.latency)
                     
-                    # Save the current frame
-                    temp_filename = "temp_capture.jpg"
-                    cv2.imwrite(temp_filename, frame)
+                    # Compress the sharpest of the last few frames once for OCR and the image models
+                    image_bytes = self.camera_manager.encode_frame(self.camera_manager.sharpest_recent_frame())
                     print("\nImage captured, processing...")
                     
+                    question_id = recorder.new_question()
+                    recorder.record_frame(question_id, image_bytes=image_bytes)
+                    
                     # Process in background thread to keep UI responsive
                     def process_image_thread():
-                        nonlocal is_processing, current_question, processing_complete, has_results
+                        # Set once the answer is out; image answers after that are recorded but not shown
+                        closed = threading.Event()
+                        
+                        # Multimodal models read the frame directly, racing the OCR pipeline
+                        def get_image_result(model_name, timeout):
+                            start = time.time()
+                            try:
+                                result_data = self.image_processors[model_name].process_image(image_bytes, timeout=timeout)
+                            except Exception as e:
+                                result_data = {"result": f"Failed: {e}", "time": time.time() - start}
+                            recorder.record_result(question_id, model_name, result_data)
+                            if closed.is_set():
+                                return
+                            state.set_result(model_name, result_data)
+                            print(f"\n{model_name.upper()} RESULT: {result_data['result']} ({result_data['time']:.2f}s)")
+                        
+                        image_executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(self.image_processors)))
+                        image_futures = [image_executor.submit(get_image_result, model_name, scheduler.model_budget()) for model_name in self.image_processors]
                         
                         try:
-                            # Extract text with OCR
+                            # Extract text with OCR, leaving most of the budget for the models
                             ocr_start_time = time.time()
-                            extracted_text = self.ocr_processor.extract_text(temp_filename)
+                            try:
+                                extracted_text = self.ocr_processor.extract_text_from_bytes(image_bytes, timeout=scheduler.ocr_timeout())
+                            except Exception as e:
+                                print(f"OCR failed: {e}")
+                                extracted_text = None
                             ocr_end_time = time.time()
-                            
-                            # Clean up temporary file
-                            if os.path.exists(temp_filename):
-                                os.remove(temp_filename)
+                            recorder.record_ocr(question_id, extracted_text, ocr_end_time - ocr_start_time)
                             
                             if not extracted_text:
                                 print("Failed to extract text from image")
-                                is_processing = False
                                 return
                             
                             # Store question for display
-                            current_question = extracted_text
+                            state.set_question(extracted_text)
                             
                             print(f"\nExtracted text ({ocr_end_time - ocr_start_time:.2f}s):")
                             print("-" * 40)
                             print(extracted_text)
                             print("-" * 40)
                             
-                            # Define tasks for parallel execution
-                            def get_model_result(model_name):
-                                processor = self.ai_processors[model_name]
-                                result_data = processor.process_text(extracted_text)
-                                
-                                # Update the shared results dictionary
-                                results[model_name] = result_data
+                            countdown = read_countdown(extracted_text)
+                            if countdown is not None:
+                                deadline.set_countdown(countdown)
+                            print(f"Answer deadline in {deadline.remaining():.1f}s ({'on-screen timer' if countdown is not None else 'configured budget'})")
+                            
+                            # A confident match in the local index answers before any model returns
+                            parsed_question = PromptBuilder.parse(extracted_text)
+                            grounded, reason = needs_grounding(parsed_question)
+                            print(f"Search grounding: {'on' if grounded else 'off'} ({reason})")
+                            index_start_time = time.time()
+                            index_hit = self.knowledge_index.lookup(parsed_question)
+                            if index_hit:
+                                index_result = {"result": index_hit["answer"], "time": time.time() - index_start_time}
+                                state.set_result("index", index_result)
+                                recorder.record_result(question_id, "index", index_result)
+                                print(f"\nINDEX RESULT: {index_hit['answer']} (matched \"{index_hit['question']}\", overlap {index_hit['overlap']:.2f})")
+                            
+                            # Publish each model's result as it arrives
+                            confident_shown = threading.Event()
+                            
+                            def publish_model_result(model_name, result_data):
+                                # Publish to the shared result state
+                                snapshot = state.set_result(model_name, result_data)
+                                recorder.record_result(question_id, model_name, result_data)
                                 
                                 # Print result as it becomes available
-                                print(f"\n{model_name.upper()} RESULT: {result_data['result']} ({result_data['time']:.2f}s)")
-                            
-                            # Execute tasks in parallel
-                            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                                executor.submit(get_model_result, "gpt4")
-                                executor.submit(get_model_result, "sonar_pro")
-                                executor.submit(get_model_result, "sonar")
-                                executor.submit(get_model_result, "gemini")
+                                print(f"\n{model_name.upper()} RESULT: {self.format_result(result_data)}")
                                 
-                                # Wait for all to complete
-                                executor.shutdown(wait=True)
+                                # A high-confidence single answer is announced without waiting for the vote
+                                confident = self.consensus.confident_answer(snapshot.results)
+                                if confident and not confident_shown.is_set():
+                                    confident_shown.set()
+                                    print(f"\n>>> CONFIDENT ANSWER: {confident[1]} ({confident[0].upper()}, {confident[2]:.0%})")
+                            
+                            # Execute tasks in parallel, local model first so its answer shows right away,
+                            # and stop waiting at the deadline with whatever has answered
+                            model_names = sorted(self.ai_processors, key=lambda name: name != "local")
+                            tasks = {
+                                model_name: functools.partial(self.ai_processors[model_name].process_text, extracted_text, grounded)
+                                for model_name in model_names
+                            }
+                            executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(model_names))
+                            _, skipped, late = scheduler.run(executor, tasks, publish_model_result)
+                            executor.shutdown(wait=False)
+                            if skipped:
+                                print(f"Skipped (too slow for the time left): {', '.join(name.upper() for name in skipped)}")
+                            if late:
+                                print(f"No answer by the deadline: {', '.join(name.upper() for name in late)}")
                             
-                            # Check for agreement after all results are in
-                            gpt4_result = results["gpt4"]["result"]
-                            sonar_pro_result = results["sonar_pro"]["result"]
-                            sonar_result = results["sonar"]["result"]
-                            gemini_result = results["gemini"]["result"]
+                            # Image answers are option text; snap them to the OCR'd choices so they can agree
+                            concurrent.futures.wait(image_futures, timeout=scheduler.model_budget())
+                            for model_name in self.image_processors:
+                                result_data = dict(state.snapshot().results[model_name])
+                                if result_data["result"]:
+                                    result_data["result"] = PromptBuilder.resolve_answer(result_data["result"], parsed_question)
+                                    state.set_result(model_name, result_data)
                             
-                            print("\n" + "="*60)
-                            if gpt4_result == sonar_pro_result == sonar_result == gemini_result:
-                                print("All models agree on the answer!")
-                            elif gpt4_result == sonar_pro_result == sonar_result:
-                                print("GPT-4, Sonar Pro, and Sonar agree, but Gemini differs")
-                            elif gpt4_result == sonar_pro_result == gemini_result:
-                                print("GPT-4, Sonar Pro, and Gemini agree, but Sonar differs")
-                            elif gpt4_result == sonar_result == gemini_result:
-                                print("GPT-4, Sonar, and Gemini agree, but Sonar Pro differs")
-                            elif sonar_pro_result == sonar_result == gemini_result:
-                                print("Sonar Pro, Sonar, and Gemini agree, but GPT-4 differs")
-                            elif gpt4_result == sonar_pro_result:
-                                print("GPT-4 and Sonar Pro agree, but Sonar and Gemini differ")
-                            elif gpt4_result == sonar_result:
-                                print("GPT-4 and Sonar agree, but Sonar Pro and Gemini differ")
-                            elif gpt4_result == gemini_result:
-                                print("GPT-4 and Gemini agree, but Sonar Pro and Sonar differ")
-                            elif sonar_pro_result == sonar_result:
-                                print("Sonar Pro and Sonar agree, but GPT-4 and Gemini differ")
-                            elif sonar_pro_result == gemini_result:
-                                print("Sonar Pro and Gemini agree, but GPT-4 and Sonar differ")
-                            elif sonar_result == gemini_result:
-                                print("Sonar and Gemini agree, but GPT-4 and Sonar Pro differ")
-                            else:
-                                print("❌ All models give different answers")
-                            print("="*60 + "\n")
+                            # Vote on the answers that are in by the deadline
+                            results = state.snapshot().results
+                            recorder.record_consensus(question_id, *self.report_consensus(results, parsed_question))
+                            
+                            # Skipping search left the quorum unsure; get grounded answers without holding up the next capture
+                            if not grounded and self.consensus.is_uncertain(results):
+                                self.confirm_with_grounding(extracted_text, parsed_question, state, recorder, question_id)
                             
                         finally:
-                            processing_complete = True
-                            has_results = True  # Set flag to show we have results
-                            is_processing = False
+                            closed.set()
+                            image_executor.shutdown(wait=False)
+                            state.finish()
                             print("Ready for next capture. Press SPACE to capture or ESC to return to menu.")
                     
                     # Start the processing thread
@@ -386,4 +486,390 @@ class RobbinHoodApp:
         
         finally:
             # Release resources
-            self.camera_manager.release() 
\ No newline at end of file
+            self.stop_frame_monitoring(monitor, profiler, recorder)
+            recorder.close()
+            self.camera_manager.release()
+    
+    def auto_triple_check(self, ocr_interval=0.4):
+        """Read the screen continuously and answer each question as it is revealed
+        
+        The models are asked the question as soon as it reads the same twice,
+        overlapping their latency with the options' reveal animation. This
+        costs one OCR call every ocr_interval seconds while the mode is open.
+        """
+        print("Starting auto triple-check mode. Questions are read automatically, P to toggle the profiler, ESC to return to menu.")
+        
+        from core.speculation import Speculator
+        
+        self.camera_manager.open()
+        
+        state = ResultState(self.ai_processors)
+        recorder = SessionRecorder(enabled=self.config.record_sessions)
+        speculator = Speculator(self.ai_processors, self.knowledge_index)
+        
+        # Owned by the OCR worker: the question being tracked and its deadline
+        current = {"question_id": None, "deadline": None}
+        
+        def answer_thread(extracted_text, parsed_question, question_id, deadline):
+            """Merge the speculative answers with the settled options and vote by the deadline"""
+            try:
+                scheduler = DeadlineScheduler(deadline, self.latency)
+                grounded, _ = needs_grounding(parsed_question)
+                
+                def publish_model_result(model_name, result_data):
+                    # A newer question owns the display now
+                    recorder.record_result(question_id, model_name, result_data)
+                    if state.snapshot().question != extracted_text:
+                        return
+                    state.set_result(model_name, result_data)
+                    print(f"\n{model_name.upper()} RESULT: {self.format_result(result_data)}{' [speculative]' if result_data.get('speculative') else ''}")
+                
+                index_result = speculator.index_result(parsed_question)
+                if index_result:
+                    publish_model_result("index", index_result)
+                
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(self.ai_processors))
+                _, _, late = scheduler.run(executor, speculator.merge_tasks(parsed_question, grounded), publish_model_result)
+                executor.shutdown(wait=False)
+                if late:
+                    print(f"No answer by the deadline: {', '.join(name.upper() for name in late)}")
+                
+                snapshot = state.snapshot()
+                if snapshot.question == extracted_text:
+                    recorder.record_consensus(question_id, *self.report_consensus(snapshot.results, parsed_question))
+            finally:
+                if state.snapshot().question == extracted_text:
+                    state.finish()
+        
+        def read_screen(image_bytes, captured_at):
+            """OCR one frame and advance the speculation; runs on the OCR worker"""
+            ocr_start_time = time.time()
+            try:
+                extracted_text = self.ocr_processor.extract_text_from_bytes(image_bytes, timeout=2.0)
+            except Exception as e:
+                print(f"OCR failed: {e}")
+                return
+            if not extracted_text:
+                return
+            
+            event, parsed_question = speculator.observe(extracted_text)
+            if event == "new":
+                state.start()
+                state.set_question(extracted_text)
+                current["question_id"] = recorder.new_question()
+                recorder.record_frame(current["question_id"], image_bytes=image_bytes)
+                current["deadline"] = Deadline(self.config.question_budget, self.config.deadline_margin, start=captured_at)
+                print(f"\nNew question: {parsed_question.question}")
+            
+            # Keep the deadline on the on-screen timer as it counts down
+            countdown = read_countdown(extracted_text)
+            if countdown is not None and current["deadline"] and parsed_question.question.endswith("?"):
+                current["deadline"].set_countdown(countdown, read_at=captured_at)
+            
+            if event == "speculating":
+                print("Question stable, asking the models before the options settle...")
+            elif event == "settled":
+                recorder.record_ocr(current["question_id"], extracted_text, time.time() - ocr_start_time)
+                state.set_question(extracted_text)
+                print("-" * 40)
+                print(extracted_text)
+                print("-" * 40)
+                
+                answer = threading.Thread(
+                    target=answer_thread,
+                    args=(extracted_text, parsed_question, current["question_id"], current["deadline"])
+                )
+                answer.daemon = True
+                answer.start()
+        
+        # One OCR request in flight at a time, at a steady rate
+        ocr_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        ocr_future = None
+        last_read = 0.0
+        
+        monitor, profiler = self.frame_monitor(), SamplingProfiler()
+        
+        try:
+            while True:
+                monitor.start_frame()
+                frame = self.camera_manager.read_frame()
+                monitor.lap("camera")
+                
+                snapshot = state.snapshot()
+                display_frame = self.display_manager.renderer.render_snapshot_overlay(frame, snapshot)
+                self.display_manager.renderer.render_frame_stats(display_frame, monitor.status_line())
+                monitor.lap("render")
+                
+                cv2.imshow('Auto Triple Check Mode', display_frame)
+                monitor.lap("imshow")
+                monitor.frame_shown()
+                
+                key = cv2.waitKey(1) & 0xFF
+                monitor.lap("waitkey")
+                
+                # ESC key to exit
+                if key == 27:  # ASCII for escape
+                    print("Returning to menu...")
+                    break
+                
+                if key == ord('p'):
+                    profiler.toggle(self.profile_dir(recorder))
+                
+                if (ocr_future is None or ocr_future.done()) and time.monotonic() - last_read >= ocr_interval:
+                    last_read = time.monotonic()
+                    image_bytes = self.camera_manager.encode_frame(self.camera_manager.sharpest_recent_frame())
+                    ocr_future = ocr_executor.submit(read_screen, image_bytes, last_read)
+                    monitor.lap("encode")
+        
+        finally:
+            self.stop_frame_monitoring(monitor, profiler, recorder)
+            ocr_executor.shutdown(wait=False)
+            speculator.close()
+            recorder.close()
+            self.camera_manager.release()
+            cv2.destroyAllWindows()
+    
+    def frame_monitor(self):
+        """Frame-time monitor for a capture loop, budgeted at the camera's frame rate"""
+        return FrameTimeMonitor(target_fps=self.camera_manager.get_profile().fps or 30)
+    
+    @staticmethod
+    def profile_dir(recorder):
+        """Profiles are written next to the session recording, or to profiles/ when recording is off"""
+        return recorder.session_dir if recorder.enabled else "profiles"
+    
+    def stop_frame_monitoring(self, monitor, profiler, recorder):
+        """Write out a profile left running and print the loop's frame-time report"""
+        if profiler.running:
+            profiler.toggle(self.profile_dir(recorder))
+        print(monitor.report())
+    
+    def confirm_with_grounding(self, extracted_text, parsed_question, state, recorder, question_id):
+        """Re-ask the search-capable models with grounding on in a background thread
+        
+        Answers are published as "<model>_grounded" results, and only while the
+        same question is still on screen.
+        """
+        processors = {name: processor for name, processor in self.ai_processors.items() if processor.supports_grounding}
+        if not processors:
+            return
+        print(f"Quorum uncertain, confirming with grounded {', '.join(name.upper() for name in processors)}...")
+        
+        def confirm_thread():
+            def get_grounded_result(model_name):
+                try:
+                    return processors[model_name].process_text(extracted_text, grounded=True)
+                except Exception as e:
+                    return {"result": f"Failed: {e}", "time": 0.0, "grounded": True}
+            
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(processors)) as executor:
+                futures = {executor.submit(get_grounded_result, model_name): model_name for model_name in processors}
+                for future in concurrent.futures.as_completed(futures):
+                    model_name = f"{futures[future]}_grounded"
+                    result_data = future.result()
+                    recorder.record_result(question_id, model_name, result_data)
+                    if state.snapshot().question != extracted_text:
+                        continue
+                    state.set_result(model_name, result_data)
+                    print(f"\n{model_name.upper()} RESULT: {result_data['result']} ({result_data['time']:.2f}s)")
+            
+            snapshot = state.snapshot()
+            if snapshot.question == extracted_text:
+                self.report_consensus(snapshot.results, parsed_question, learn=False)
+        
+        confirm = threading.Thread(target=confirm_thread)
+        confirm.daemon = True
+        confirm.start()
+    
+    @staticmethod
+    def format_result(result_data):
+        """One-line result summary with timing and, when reported, confidence"""
+        confidence = f", {result_data['confidence']:.0%}" if result_data.get("confidence") is not None else ""
+        return f"{result_data['result']} ({result_data['time']:.2f}s{confidence})"
+    
+    def report_consensus(self, results, parsed_question, learn=True):
+        """Print the weighted consensus, learn from it and remember confident answers
+        
+        Returns (answer, share of vote weight, agreeing models).
+        """
+        answer, share, agreeing = self.consensus.vote(results)
+        
+        # Models that missed the deadline have no answer and neither agree nor differ
+        differing = [name for name in results if name not in agreeing and results[name]["result"]]
+        
+        print("\n" + "="*60)
+        if answer is None:
+            print("❌ No model returned an answer")
+        elif not differing:
+            print("All models agree on the answer!")
+        elif len(agreeing) == 1:
+            print("❌ All models give different answers")
+        else:
+            print(f"{', '.join(name.upper() for name in agreeing)} agree, but {', '.join(name.upper() for name in differing)} differ")
+        if answer is not None:
+            print(f"Consensus: {answer} ({share:.0%} of vote weight)")
+        print("="*60 + "\n")
+        
+        if not learn:
+            return answer, share, agreeing
+        
+        self.consensus.update(results)
+        
+        # Remember agreed answers so the same question is instant next time,
+        # except time-sensitive ones whose answer may have changed by then
+        if answer is not None and len(agreeing) >= 2 and share >= 0.6 and parsed_question.question and not needs_grounding(parsed_question)[0]:
+            self.knowledge_index.add(parsed_question.question, answer)
+        
+        return answer, share, agreeing
+    
+    def continuous_triple_check_multiprocess(self):
+        """Triple check with capture, OCR and model calls in separate processes so the UI never stalls"""
+        print("Starting multi-process triple-check mode. Press SPACE to capture an image, P to toggle the profiler, ESC to return to menu.")
+        
+        from core.pipeline import MultiProcessPipeline
+        
+        # The capture process needs exclusive access to the camera
+        self.camera_manager.release()
+        pipeline = MultiProcessPipeline(self.camera_manager.camera_index)
+        pipeline.start()
+        
+        state = ResultState(self.ai_processors)
+        last_render = None
+        
+        recorder = SessionRecorder(enabled=self.config.record_sessions)
+        question_id = None
+        confident_shown = False
+        
+        # The loop polls far faster than the camera, so missed frames are only counted on redraws
+        monitor, profiler = self.frame_monitor(), SamplingProfiler()
+        
+        try:
+            while True:
+                monitor.start_frame()
+                frame_sequence, frame = pipeline.latest_frame()
+                monitor.lap("camera")
+                
+                # Apply results streamed back from the worker processes
+                for message in pipeline.poll_messages():
+                    if message[0] == "question":
+                        state.set_question(message[1])
+                        recorder.record_ocr(question_id, message[1], message[2])
+                        print(f"\nExtracted text ({message[2]:.2f}s):")
+                        print("-" * 40)
+                        print(message[1])
+                        print("-" * 40)
+                    elif message[0] == "result":
+                        model_name, result_data = message[1], message[2]
+                        snapshot = state.set_result(model_name, result_data)
+                        recorder.record_result(question_id, model_name, result_data)
+                        print(f"\n{model_name.upper()} RESULT: {self.format_result(result_data)}")
+                        
+                        confident = self.consensus.confident_answer(snapshot.results)
+                        if confident and not confident_shown:
+                            confident_shown = True
+                            print(f"\n>>> CONFIDENT ANSWER: {confident[1]} ({confident[0].upper()}, {confident[2]:.0%})")
+                    elif message[0] == "confirmation":
+                        # Grounded second opinions arrive after "done"; drop any for a previous question
+                        model_name, result_data, question = message[1], message[2], message[3]
+                        if state.snapshot().question == question:
+                            state.set_result(model_name, result_data)
+                            recorder.record_result(question_id, model_name, result_data)
+                            print(f"\n{model_name.upper()} RESULT: {result_data['result']} ({result_data['time']:.2f}s)")
+                    elif message[0] == "confirmed":
+                        snapshot = state.snapshot()
+                        if snapshot.question == message[1]:
+                            self.report_consensus(snapshot.results, PromptBuilder.parse(snapshot.question), learn=False)
+                    elif message[0] == "failed":
+                        print(message[1])
+                        state.finish()
+                    elif message[0] == "done":
+                        snapshot = state.snapshot()
+                        recorder.record_consensus(question_id, *self.report_consensus(snapshot.results, PromptBuilder.parse(snapshot.question)))
+                        state.finish()
+                        print("Ready for next capture. Press SPACE to capture or ESC to return to menu.")
+                
+                monitor.lap("messages")
+                
+                # Only redraw when there is a new frame or the result state has changed
+                snapshot = state.snapshot()
+                if frame is not None and (frame_sequence, snapshot.version) != last_render:
+                    display_frame = self.display_manager.renderer.render_snapshot_overlay(frame, snapshot)
+                    self.display_manager.renderer.render_frame_stats(display_frame, monitor.status_line())
+                    monitor.lap("render")
+                    cv2.imshow('Multi-process Triple Check Mode', display_frame)
+                    monitor.lap("imshow")
+                    monitor.frame_shown()
+                    last_render = (frame_sequence, snapshot.version)
+                
+                key = cv2.waitKey(1) & 0xFF
+                monitor.lap("waitkey")
+                
+                # ESC key to exit
+                if key == 27:  # ASCII for escape
+                    print("Returning to menu...")
+                    break
+                
+                if key == ord('p'):
+                    profiler.toggle(self.profile_dir(recorder))
+                
+                # Space key hands the current frame to the OCR process
+                if key == 32 and not snapshot.is_processing and frame is not None:  # ASCII for space
+                    state.start()
+                    confident_shown = False
+                    pipeline.request_capture(frame_sequence, self.config.question_budget, self.config.deadline_margin)
+                    print("\nImage captured, processing...")
+                    
+                    question_id = recorder.new_question()
+                    recorder.record_frame(question_id, frame=frame)
+        
+        finally:
+            self.stop_frame_monitoring(monitor, profiler, recorder)
+            recorder.close()
+            pipeline.stop()
+            cv2.destroyAllWindows()
+    
+    def replay_session(self, root="sessions"):
+        """Re-run a recorded session's questions through the models and compare with what was recorded"""
+        sessions = sorted(os.listdir(root)) if os.path.isdir(root) else []
+        if not sessions:
+            print("No recorded sessions found.")
+            return
+        
+        print("\nRecorded sessions:")
+        for i, name in enumerate(sessions):
+            print(f"{i+1}. {name}")
+        try:
+            selection = int(input(f"Select session (1-{len(sessions)}): "))
+            session_dir = os.path.join(root, sessions[selection-1])
+        except (ValueError, IndexError):
+            print("Invalid selection.")
+            return
+        
+        for question in load_session(session_dir):
+            # Prefer the recorded OCR text; fall back to OCR on the recorded frame
+            extracted_text = question["ocr_text"]
+            if not extracted_text and question["frame_path"]:
+                extracted_text = self.ocr_processor.extract_text(question["frame_path"])
+            if not extracted_text:
+                continue
+            
+            print(f"\nQuestion {question['id']}:")
+            print("-" * 40)
+            print(extracted_text)
+            print("-" * 40)
+            
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.ai_processors)) as executor:
+                futures = {
+                    model_name: executor.submit(processor.process_text, extracted_text)
+                    for model_name, processor in self.ai_processors.items()
+                }
+                results = {model_name: future.result() for model_name, future in futures.items()}
+            
+            for model_name, result_data in results.items():
+                recorded = question["results"].get(model_name)
+                recorded_text = f"{recorded['result']} ({recorded['time']:.2f}s)" if recorded else "-"
+                print(f"{model_name.upper()}: {result_data['result']} ({result_data['time']:.2f}s) | recorded: {recorded_text}")
+            
+            self.report_consensus(results, PromptBuilder.parse(extracted_text), learn=False)
+            if question["consensus"]:
+                print(f"Recorded consensus: {question['consensus']['answer']}")
\ No newline at end of file
@@ -0,0 +1,110 @@
+import json
+import os
+import threading
+
+# A single model's self-reported confidence at which its answer is shown without waiting for the vote
+CONFIDENT_ANSWER = 0.9
+
+class ConsensusTracker:
+    """Weighted vote across model answers, with per-model weights learned from agreement history
+    
+    A model's weight is how often it agreed with the answer the other models
+    settled on, so a fast but less reliable voter (e.g. the local model) counts
+    for less until it has earned its place.
+    """
+    
+    def __init__(self, weights_path="consensus_weights.json", prior_weights=None):
+        self.weights_path = weights_path
+        self.prior_weights = prior_weights if prior_weights else {}
+        self.history = self._load()
+        self.lock = threading.Lock()
+    
+    def _load(self):
+        """Load agreement history from disk"""
+        if not os.path.exists(self.weights_path):
+            return {}
+        try:
+            with open(self.weights_path) as weights_file:
+                return json.load(weights_file)
+        except (OSError, ValueError) as e:
+            print(f"Could not load consensus weights: {e}")
+            return {}
+    
+    def _save(self):
+        """Persist agreement history to disk"""
+        try:
+            with open(self.weights_path, "w") as weights_file:
+                json.dump(self.history, weights_file, indent=2)
+        except OSError as e:
+            print(f"Could not save consensus weights: {e}")
+    
+    def weight(self, model_name):
+        """Return the learned weight for a model"""
+        prior = self.prior_weights.get(model_name, 1.0)
+        stats = self.history.get(model_name)
+        if not stats:
+            return prior
+        
+        # Smoothed agreement rate, starting from the prior
+        return (stats["agreed"] + prior) / (stats["total"] + 1)
+    
+    @staticmethod
+    def _answers(results):
+        """Return the usable answers keyed by model name"""
+        return {
+            model_name: data["result"]
+            for model_name, data in results.items()
+            if data.get("result") and not str(data["result"]).startswith("Failed")
+        }
+    
+    def vote(self, results):
+        """Return (answer, share of total weight, agreeing models) for the weighted winner"""
+        answers = self._answers(results)
+        if not answers:
+            return None, 0.0, []
+        
+        scores = {}
+        for model_name, answer in answers.items():
+            scores[answer] = scores.get(answer, 0.0) + self.weight(model_name)
+        
+        best = max(scores, key=scores.get)
+        total = sum(scores.values())
+        agreeing = [model_name for model_name, answer in answers.items() if answer == best]
+        return best, scores[best] / total if total else 0.0, agreeing
+    
+    def confident_answer(self, results, min_confidence=CONFIDENT_ANSWER):
+        """Return (model, answer, confidence) for the most confident single answer above the threshold, or None"""
+        answers = self._answers(results)
+        confident = [
+            (model_name, answer, results[model_name]["confidence"])
+            for model_name, answer in answers.items()
+            if (results[model_name].get("confidence") or 0.0) >= min_confidence
+        ]
+        return max(confident, key=lambda item: item[2] * self.weight(item[0])) if confident else None
+    
+    def is_uncertain(self, results, min_share=0.75, min_agreeing=2):
+        """Whether the weighted vote is too weak to trust without a second opinion"""
+        answer, share, agreeing = self.vote(results)
+        return answer is None or share < min_share or len(agreeing) < min_agreeing
+    
+    def update(self, results):
+        """Record each model's agreement with the majority of the other models"""
+        answers = self._answers(results)
+        
+        with self.lock:
+            for model_name, answer in answers.items():
+                others = [other for name, other in answers.items() if name != model_name]
+                if len(others) < 2:
+                    continue
+                
+                # Only learn from questions where the other models clearly agree
+                majority = max(set(others), key=others.count)
+                if others.count(majority) * 2 <= len(others):
+                    continue
+                
+                stats = self.history.setdefault(model_name, {"agreed": 0, "total": 0})
+                stats["total"] += 1
+                if answer == majority:
+                    stats["agreed"] += 1
+            
+            self._save()
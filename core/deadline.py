@@ -0,0 +1,141 @@
+import concurrent.futures
+import re
+import threading
+import time
+from ai.prompt_builder import TIMES_UP
+
+# On-screen timer as OCR'd above the question: "10", "0:08"; "TIME'S UP" means none left
+COUNTDOWN_LINE = re.compile(r"^(?:(\d{1,2}):)?(\d{1,2})$")
+
+def read_countdown(text, max_seconds=30):
+    """Return the seconds left on the contest timer from raw OCR text, or None if it isn't visible
+    
+    Only lines above the question are considered, so numeric answer choices
+    and player counts ("134,880") are never mistaken for the timer.
+    """
+    for line in (text or "").splitlines():
+        line = line.strip()
+        if line.endswith("?"):
+            break
+        if TIMES_UP.search(line):
+            return 0
+        match = COUNTDOWN_LINE.match(line)
+        if match:
+            seconds = int(match.group(1) or 0) * 60 + int(match.group(2))
+            if seconds <= max_seconds:
+                return seconds
+    return None
+
+class Deadline:
+    """Point in time by which an answer must be on screen, with a margin kept back for the player to tap it"""
+    
+    def __init__(self, budget, margin=1.0, start=None):
+        self.start = start if start is not None else time.monotonic()
+        self.margin = margin
+        self.at = self.start + budget - margin
+    
+    def remaining(self):
+        """Seconds left before the deadline, never negative"""
+        return max(0.0, self.at - time.monotonic())
+    
+    def expired(self):
+        return self.remaining() <= 0
+    
+    def set_countdown(self, seconds_left, read_at=None):
+        """Re-anchor on the timer read from a frame captured at read_at (default: the start)"""
+        self.at = (read_at if read_at is not None else self.start) + seconds_left - self.margin
+
+class LatencyTracker:
+    """Exponentially weighted moving average of each stage's latency
+    
+    A stage that is skipped is never measured again, so its average is shrunk
+    by skip_decay each time; a model that was slow once gets retried after a
+    few questions instead of being left out for good.
+    """
+    
+    def __init__(self, alpha=0.3, skip_decay=0.8):
+        self.alpha = alpha
+        self.skip_decay = skip_decay
+        self.averages = {}
+        self.lock = threading.Lock()
+    
+    def update(self, name, seconds):
+        with self.lock:
+            previous = self.averages.get(name)
+            self.averages[name] = seconds if previous is None else previous + self.alpha * (seconds - previous)
+    
+    def skipped(self, name):
+        with self.lock:
+            if name in self.averages:
+                self.averages[name] *= self.skip_decay
+    
+    def expected(self, name):
+        """Expected latency for a stage, or None before it has been measured"""
+        return self.averages.get(name)
+
+class DeadlineScheduler:
+    """Runs one question's model calls against its deadline
+    
+    Each call gets the time left (less a reserve for the vote) as its request
+    timeout; calls whose usual latency no longer fits are not started at all.
+    At the deadline, whatever has answered is returned and the stragglers are
+    abandoned, so the best answer available is always shown in time.
+    """
+    
+    def __init__(self, deadline, latency, consensus_reserve=0.1, ocr_share=0.4):
+        self.deadline = deadline
+        self.latency = latency
+        self.consensus_reserve = consensus_reserve
+        self.ocr_share = ocr_share
+    
+    def ocr_timeout(self):
+        """OCR may use a share of the budget; the models need the rest"""
+        return max(0.1, self.deadline.remaining() * self.ocr_share)
+    
+    def model_budget(self):
+        """Seconds the model calls may take, keeping the consensus reserve"""
+        return max(0.0, self.deadline.remaining() - self.consensus_reserve)
+    
+    def fits(self, name):
+        """Whether a stage's usual latency still fits in the remaining budget"""
+        expected = self.latency.expected(name)
+        return expected is None or expected <= self.model_budget()
+    
+    def run(self, executor, tasks, on_result=None):
+        """Run task(timeout) for each named task and collect results until the deadline
+        
+        Returns (results, skipped, late): result dicts by name, names that were
+        never started, and names that had not answered by the deadline.
+        """
+        skipped = [name for name in tasks if not self.fits(name)]
+        for name in skipped:
+            self.latency.skipped(name)
+        budget = self.model_budget()
+        
+        def timed(name, task):
+            # Stragglers keep running after the deadline and still report how slow they were
+            start = time.monotonic()
+            try:
+                return task(budget)
+            except Exception as e:
+                return {"result": f"Failed: {e}", "time": time.monotonic() - start}
+            finally:
+                self.latency.update(name, time.monotonic() - start)
+        
+        futures = {executor.submit(timed, name, task): name for name, task in tasks.items() if name not in skipped}
+        results = {}
+        try:
+            for future in concurrent.futures.as_completed(futures, timeout=self.model_budget()):
+                name = futures[future]
+                results[name] = future.result()
+                if on_result:
+                    on_result(name, results[name])
+        except concurrent.futures.TimeoutError:
+            pass
+        
+        # Calls still queued are dropped; ones in flight end at their request timeout
+        late = [name for future, name in futures.items() if name not in results]
+        for future, name in futures.items():
+            if name in late:
+                future.cancel()
+        return results, skipped, late
@@ -0,0 +1,79 @@
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+
+class SharedFrameRing:
+    """Ring buffer of video frames in shared memory
+    
+    The writer copies each frame into the next slot and bumps a shared sequence
+    counter. Readers in other processes map the same memory, so only the
+    sequence number ever needs to cross a process boundary.
+    """
+    
+    def __init__(self, shape, sequence, slots=16, name=None):
+        self.shape = tuple(shape)
+        self.slots = slots
+        frame_size = int(np.prod(self.shape))
+        
+        # The sequence counter is a multiprocessing.Value, so it has to be handed
+        # to child processes as a Process argument rather than through a queue
+        self.sequence = sequence
+        
+        # Create the segment unless we are attaching to an existing one
+        self.owner = name is None
+        if self.owner:
+            self.memory = shared_memory.SharedMemory(create=True, size=frame_size * slots)
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+        
+        self.frames = np.ndarray((slots,) + self.shape, dtype=np.uint8, buffer=self.memory.buf)
+    
+    @staticmethod
+    def create_sequence(context=multiprocessing):
+        """Create the shared sequence counter for a new ring, in the context its processes are started with"""
+        return context.Value("q", -1)
+    
+    def spec(self):
+        """Return the picklable description another process needs to attach"""
+        return {"shape": self.shape, "slots": self.slots, "name": self.memory.name}
+    
+    @classmethod
+    def attach(cls, spec, sequence):
+        """Attach to a ring created in another process"""
+        return cls(spec["shape"], sequence, slots=spec["slots"], name=spec["name"])
+    
+    def write(self, frame):
+        """Copy a frame into the next slot and return its sequence number"""
+        next_sequence = self.sequence.value + 1
+        self.frames[next_sequence % self.slots][...] = frame
+        
+        # Publish only after the copy is complete
+        self.sequence.value = next_sequence
+        return next_sequence
+    
+    def latest(self):
+        """Return the newest sequence number, or -1 if nothing has been written"""
+        return self.sequence.value
+    
+    def read(self, sequence, copy=True):
+        """Return the frame for a sequence number, or None if it has been overwritten"""
+        latest = self.sequence.value
+        if sequence < 0 or sequence > latest or latest - sequence >= self.slots - 1:
+            return None
+        
+        frame = self.frames[sequence % self.slots]
+        if not copy:
+            return frame
+        
+        # The writer may have lapped us during the copy
+        frame = frame.copy()
+        if self.sequence.value - sequence >= self.slots - 1:
+            return None
+        return frame
+    
+    def close(self):
+        """Detach from the shared memory, and free it if this process created it"""
+        del self.frames
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
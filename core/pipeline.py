@@ -0,0 +1,236 @@
+import multiprocessing
+import queue
+import threading
+import functools
+import time
+import concurrent.futures
+from core.frame_ring import SharedFrameRing
+from core.deadline import Deadline, DeadlineScheduler, LatencyTracker, read_countdown
+from camera.focus import sharpest_frame
+
+# Frames considered for each capture: the requested one and those just before it
+BURST_FRAMES = 3
+
+def read_burst(ring, frame_sequence, size=BURST_FRAMES):
+    """Return the requested frame and the ones just before it that are still in the ring
+    
+    If the reader fell so far behind that all of them were overwritten, the
+    newest frame is returned instead so the question is still answered.
+    """
+    burst = [ring.read(frame_sequence - offset) for offset in range(size)]
+    burst = [frame for frame in burst if frame is not None]
+    if not burst:
+        newest = ring.read(ring.latest())
+        if newest is not None:
+            burst.append(newest)
+    return burst
+
+def _capture_process(camera_index, sequence, slots, ready_queue, stop_event):
+    """Read camera frames into the shared ring until stopped"""
+    from camera.camera_manager import CameraManager
+    
+    camera_manager = CameraManager(camera_index)
+    ring = None
+    try:
+        camera_manager.open()
+        frame = camera_manager.read_frame()
+        ring = SharedFrameRing(frame.shape, sequence, slots=slots)
+        ring.write(frame)
+        ready_queue.put(ring.spec())
+        
+        while not stop_event.is_set():
+            ring.write(camera_manager.read_frame())
+    except Exception as e:
+        ready_queue.put({"error": str(e)})
+    finally:
+        # Keep the segment alive until the other processes have let go of it
+        stop_event.wait()
+        if ring:
+            ring.close()
+        camera_manager.release()
+
+def _ocr_process(ring_spec, sequence, request_queue, text_queue, result_queue, stop_event):
+    """Encode requested frames and run OCR on them, passing each question on with its answer deadline"""
+    import cv2
+    from config import Config
+    from ocr.ocr_processor import OCRProcessor
+    
+    ocr_processor = OCRProcessor(Config().vision_client)
+    ring = SharedFrameRing.attach(ring_spec, sequence)
+    try:
+        while not stop_event.is_set():
+            try:
+                frame_sequence, captured_at, budget, margin = request_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            
+            # Anchor the deadline at the moment of capture in the UI process
+            deadline = Deadline(budget, margin, start=time.monotonic() - (time.time() - captured_at))
+            
+            # Pick the sharpest of the requested frame and the ones just before it
+            ocr_start_time = time.time()
+            frame, score = sharpest_frame(read_burst(ring, frame_sequence))
+            if frame is None:
+                result_queue.put(("failed", "No captured frame could be read"))
+                continue
+            
+            ok, encoded = cv2.imencode(".jpg", frame)
+            try:
+                extracted_text = ocr_processor.extract_text_from_bytes(encoded.tobytes(), timeout=max(0.1, deadline.remaining() * 0.4)) if ok else None
+            except Exception as e:
+                print(f"OCR failed: {e}")
+                extracted_text = None
+            if not extracted_text:
+                result_queue.put(("failed", "Failed to extract text from image"))
+                continue
+            
+            countdown = read_countdown(extracted_text)
+            if countdown is not None:
+                deadline.set_countdown(countdown)
+            
+            # Deadlines cross the process boundary as wall-clock times
+            result_queue.put(("question", extracted_text, time.time() - ocr_start_time))
+            text_queue.put((extracted_text, time.time() + deadline.remaining()))
+    finally:
+        ring.close()
+
+def _model_process(text_queue, result_queue, stop_event):
+    """Fan questions out to every AI processor and stream back results
+    
+    "done" is sent at the question's deadline with whatever has answered.
+    Static-fact questions skip search grounding; when that leaves the vote
+    uncertain, grounded confirmations are streamed back after "done".
+    """
+    from config import Config
+    from ai.factory import create_ai_processors
+    from ai.prompt_builder import PromptBuilder
+    from ai.grounding import needs_grounding
+    from core.consensus import ConsensusTracker
+    from knowledge.index import KnowledgeIndex
+    
+    ai_processors = create_ai_processors(Config())
+    knowledge_index = KnowledgeIndex()
+    consensus = ConsensusTracker(prior_weights={"local": 0.5})
+    latency = LatencyTracker()
+    grounding_processors = {name: processor for name, processor in ai_processors.items() if processor.supports_grounding}
+    
+    def confirm(extracted_text, futures):
+        """Stream grounded answers for a question, then signal that they are all in"""
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                result_data = future.result()
+            except Exception as e:
+                result_data = {"result": f"Failed: {e}", "time": 0.0, "grounded": True}
+            result_queue.put(("confirmation", f"{futures[future]}_grounded", result_data, extracted_text))
+        result_queue.put(("confirmed", extracted_text))
+    
+    # Background confirmations get their own workers so they never queue ahead of the next question
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(grounding_processors))) as confirm_executor:
+        while not stop_event.is_set():
+            try:
+                extracted_text, deadline_at = text_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            
+            scheduler = DeadlineScheduler(Deadline(deadline_at - time.time(), margin=0.0), latency)
+            
+            parsed_question = PromptBuilder.parse(extracted_text)
+            grounded, _ = needs_grounding(parsed_question)
+            
+            index_start_time = time.time()
+            index_hit = knowledge_index.lookup(parsed_question)
+            if index_hit:
+                result_queue.put(("result", "index", {"result": index_hit["answer"], "time": time.time() - index_start_time}))
+            
+            # Stragglers past the deadline are abandoned along with their executor
+            tasks = {
+                model_name: functools.partial(processor.process_text, extracted_text, grounded)
+                for model_name, processor in ai_processors.items()
+            }
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(tasks))
+            results, _, _ = scheduler.run(executor, tasks, lambda model_name, result_data: result_queue.put(("result", model_name, result_data)))
+            executor.shutdown(wait=False)
+            
+            result_queue.put(("done",))
+            
+            if not grounded and grounding_processors and consensus.is_uncertain(results):
+                confirm_futures = {
+                    confirm_executor.submit(processor.process_text, extracted_text, True): model_name
+                    for model_name, processor in grounding_processors.items()
+                }
+                threading.Thread(target=confirm, args=(extracted_text, confirm_futures), daemon=True).start()
+
+class MultiProcessPipeline:
+    """Capture, OCR and model fan-out in separate processes, sharing frames through shared memory
+    
+    Only frame sequence numbers and small result messages cross process
+    boundaries, so the UI process never contends for the GIL with encoding,
+    JSON parsing or network I/O.
+    """
+    
+    def __init__(self, camera_index, slots=16):
+        self.camera_index = camera_index
+        self.slots = slots
+        self.context = multiprocessing.get_context("spawn")
+        self.processes = []
+        self.ring = None
+    
+    def start(self, timeout=15):
+        """Start the worker processes and attach to the capture ring"""
+        sequence = SharedFrameRing.create_sequence(self.context)
+        ready_queue = self.context.Queue()
+        self.stop_event = self.context.Event()
+        self.request_queue = self.context.Queue()
+        self.text_queue = self.context.Queue()
+        self.result_queue = self.context.Queue()
+        
+        self._spawn(_capture_process, self.camera_index, sequence, self.slots, ready_queue, self.stop_event)
+        
+        try:
+            ring_spec = ready_queue.get(timeout=timeout)
+        except queue.Empty:
+            ring_spec = {"error": "Timed out waiting for the camera"}
+        if "error" in ring_spec:
+            self.stop()
+            raise RuntimeError(f"Capture process failed: {ring_spec['error']}")
+        
+        self.ring = SharedFrameRing.attach(ring_spec, sequence)
+        self._spawn(_ocr_process, ring_spec, sequence, self.request_queue, self.text_queue, self.result_queue, self.stop_event)
+        self._spawn(_model_process, self.text_queue, self.result_queue, self.stop_event)
+    
+    def _spawn(self, target, *args):
+        """Start a daemon worker process"""
+        process = self.context.Process(target=target, args=args, daemon=True)
+        process.start()
+        self.processes.append(process)
+    
+    def latest_frame(self):
+        """Return (sequence, frame) for the newest captured frame"""
+        frame_sequence = self.ring.latest()
+        return frame_sequence, self.ring.read(frame_sequence)
+    
+    def request_capture(self, frame_sequence, budget, margin=1.0):
+        """Ask the OCR process to work on a captured frame, to be answered within budget seconds"""
+        self.request_queue.put((frame_sequence, time.time(), budget, margin))
+    
+    def poll_messages(self):
+        """Return every result message that has arrived, without blocking"""
+        messages = []
+        while True:
+            try:
+                messages.append(self.result_queue.get_nowait())
+            except queue.Empty:
+                return messages
+    
+    def stop(self, timeout=5):
+        """Stop the worker processes and release shared memory"""
+        if self.ring:
+            self.ring.close()
+            self.ring = None
+        
+        self.stop_event.set()
+        for process in self.processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self.processes = []
@@ -0,0 +1,178 @@
+import bisect
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+class FrameTimeMonitor:
+    """Rolling loop-iteration statistics for a UI loop, with a breakdown by step
+    
+    Call start_frame() at the top of every iteration, lap(step) after each
+    step (camera read, render, imshow, waitKey) and frame_shown() after each
+    imshow. A gap between shown frames longer than the frame budget counts
+    every budget it overran as a missed frame.
+    """
+    
+    BUCKETS_MS = (8, 16, 33, 50, 100, 250)
+    
+    def __init__(self, target_fps=30, window=600, status_every=15):
+        self.budget = 1.0 / target_fps
+        self.window = window
+        self.frame_times = deque(maxlen=window)
+        self.histogram = [0] * (len(self.BUCKETS_MS) + 1)
+        self.step_times = {}
+        self.frames = 0
+        self.missed = 0
+        self.frame_start = None
+        self.lap_start = None
+        self.last_shown = None
+        
+        # The overlay line needs sorted percentiles, so it is only recomputed every few frames
+        self.status_every = status_every
+        self.status = ""
+    
+    def start_frame(self):
+        """Close the previous iteration and start timing the next"""
+        now = time.perf_counter()
+        if self.frame_start is not None:
+            elapsed = now - self.frame_start
+            self.frame_times.append(elapsed)
+            self.histogram[bisect.bisect_left(self.BUCKETS_MS, elapsed * 1000)] += 1
+            self.frames += 1
+        self.frame_start = self.lap_start = now
+    
+    def frame_shown(self):
+        """Count the frames skipped since the previous one was shown"""
+        now = time.perf_counter()
+        if self.last_shown is not None:
+            self.missed += max(0, int((now - self.last_shown) / self.budget) - 1)
+        self.last_shown = now
+    
+    def lap(self, step):
+        """Attribute the time since the last lap to a step"""
+        if self.lap_start is None:
+            return
+        now = time.perf_counter()
+        times = self.step_times.get(step)
+        if times is None:
+            times = self.step_times[step] = deque(maxlen=self.window)
+        times.append(now - self.lap_start)
+        self.lap_start = now
+    
+    @staticmethod
+    def _percentile(values, fraction):
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+    
+    def status_line(self):
+        """Short summary for the overlay"""
+        if self.frame_times and (not self.status or self.frames % self.status_every == 0):
+            p50 = self._percentile(self.frame_times, 0.5) * 1000
+            p99 = self._percentile(self.frame_times, 0.99) * 1000
+            self.status = f"loop {p50:.0f}ms p99 {p99:.0f}ms | missed {self.missed}"
+        return self.status
+    
+    def report(self):
+        """Histogram of every frame so far and per-step timings over the recent window"""
+        lines = [f"Loop times over {self.frames} iterations ({self.missed} frames missed at {1 / self.budget:.0f} fps):"]
+        bounds = ("0",) + tuple(str(bound) for bound in self.BUCKETS_MS)
+        for i, count in enumerate(self.histogram):
+            label = f"{bounds[i]}-{self.BUCKETS_MS[i]}ms" if i < len(self.BUCKETS_MS) else f">{self.BUCKETS_MS[-1]}ms"
+            share = count / self.frames if self.frames else 0.0
+            lines.append(f"  {label:>10s} {count:7d} {'#' * round(40 * share)}")
+        
+        lines.append(f"Steps over the last {len(self.frame_times)} iterations (p50 / p99 / max):")
+        for step, times in self.step_times.items():
+            lines.append(f"  {step:10s} {self._percentile(times, 0.5) * 1000:6.1f} / "
+                         f"{self._percentile(times, 0.99) * 1000:6.1f} / {max(times) * 1000:6.1f}ms")
+        return "\n".join(lines)
+
+class SamplingProfiler:
+    """Samples every thread's Python stack on an interval and writes collapsed stacks for flame graphs
+    
+    Nothing is instrumented: a background thread reads sys._current_frames()
+    every interval and counts identical stacks, so the cost while running is
+    only the sampling itself. The output is one "thread;outer;...;inner count"
+    line per stack, readable by flamegraph.pl, speedscope or inferno.
+    """
+    
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.counts = {}
+        self.samples = 0
+        self.sample_time = 0.0
+        self.thread = None
+        self.stop_event = threading.Event()
+    
+    @property
+    def running(self):
+        return self.thread is not None
+    
+    def start(self):
+        """Start sampling from an empty profile"""
+        if self.running:
+            return
+        self.counts = {}
+        self.samples = 0
+        self.sample_time = 0.0
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._sample_loop, name="sampling-profiler", daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        """Stop sampling, keeping the collected profile"""
+        if not self.running:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+    
+    def _sample_loop(self):
+        own_id = threading.get_ident()
+        names = {}
+        while not self.stop_event.wait(self.interval):
+            sample_start = time.perf_counter()
+            frames = sys._current_frames()
+            
+            # Thread names only change when threads come and go
+            if frames.keys() - names.keys():
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+            
+            for thread_id, frame in frames.items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                key = ";".join(reversed(stack))
+                self.counts[key] = self.counts.get(key, 0) + 1
+            self.samples += 1
+            self.sample_time += time.perf_counter() - sample_start
+    
+    def overhead(self):
+        """Share of wall time spent taking samples, which is time other threads can't hold the GIL"""
+        return self.sample_time / (self.samples * self.interval) if self.samples else 0.0
+    
+    def dump(self, path):
+        """Write the collapsed stacks to path"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as profile_file:
+            for stack, count in sorted(self.counts.items()):
+                profile_file.write(f"{stack} {count}\n")
+        return path
+    
+    def toggle(self, output_dir):
+        """Start sampling, or stop and write the profile to output_dir and return its path"""
+        if not self.running:
+            self.start()
+            print(f"Sampling profiler started (every {self.interval * 1000:.0f}ms, all threads)")
+            return None
+        
+        self.stop()
+        path = self.dump(os.path.join(output_dir, f"profile-{time.strftime('%Y%m%d-%H%M%S')}.collapsed"))
+        print(f"Sampling profiler stopped after {self.samples} samples ({self.overhead():.1%} overhead), wrote {path}")
+        return path
@@ -0,0 +1,134 @@
+import json
+import os
+import queue
+import threading
+import time
+
+class SessionRecorder:
+    """Records each question's frame, OCR text, model results and consensus to a session archive
+    
+    Callers only enqueue small records; JPEG encoding and all file I/O happen on
+    a background writer thread. The queue is bounded and records are dropped
+    rather than ever blocking the capture or UI loops.
+    
+    Archive layout: <root>/<session>/session.jsonl plus frames/<question>.jpg
+    """
+    
+    def __init__(self, root="sessions", max_queue=64, enabled=True):
+        self.enabled = enabled
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.question_count = 0
+        
+        # A disabled recorder accepts every call and writes nothing
+        if not enabled:
+            return
+        
+        self.session_dir = os.path.join(root, time.strftime("%Y%m%d-%H%M%S"))
+        self.frames_dir = os.path.join(self.session_dir, "frames")
+        os.makedirs(self.frames_dir, exist_ok=True)
+        
+        self.writer_thread = threading.Thread(target=self._writer, daemon=True)
+        self.writer_thread.start()
+        print(f"Recording session to {self.session_dir}")
+    
+    def new_question(self):
+        """Start a new question and return its id"""
+        self.question_count += 1
+        return self.question_count
+    
+    def _enqueue(self, record):
+        """Queue a record for the writer without blocking"""
+        if not self.enabled:
+            return
+        record["timestamp"] = time.time()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+    
+    def record_frame(self, question_id, frame=None, image_bytes=None):
+        """Record the captured frame, either already JPEG-encoded or as a raw array to encode in the background"""
+        self._enqueue({"type": "frame", "question": question_id, "frame": frame, "image_bytes": image_bytes})
+    
+    def record_ocr(self, question_id, text, elapsed):
+        """Record the OCR output for a question"""
+        self._enqueue({"type": "ocr", "question": question_id, "text": text, "time": elapsed})
+    
+    def record_result(self, question_id, model_name, result_data):
+        """Record one model's raw response and timing"""
+        self._enqueue({"type": "result", "question": question_id, "model": model_name, **result_data})
+    
+    def record_consensus(self, question_id, answer, share, agreeing):
+        """Record the consensus reached for a question"""
+        self._enqueue({"type": "consensus", "question": question_id, "answer": answer, "share": share, "agreeing": agreeing})
+    
+    def _writer(self):
+        """Write queued records to disk until the sentinel arrives"""
+        with open(os.path.join(self.session_dir, "session.jsonl"), "a", encoding="utf-8") as log_file:
+            while True:
+                record = self.queue.get()
+                if record is None:
+                    break
+                
+                try:
+                    if record["type"] == "frame":
+                        record = self._write_frame(record)
+                    log_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    log_file.flush()
+                except Exception as e:
+                    print(f"Session recorder error: {e}")
+    
+    def _write_frame(self, record):
+        """Write a frame to the archive and return the record that points at it"""
+        image_bytes = record.pop("image_bytes")
+        frame = record.pop("frame")
+        if image_bytes is None:
+            import cv2
+            ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+            image_bytes = encoded.tobytes() if ok else b""
+        
+        filename = f"{record['question']:04d}.jpg"
+        with open(os.path.join(self.frames_dir, filename), "wb") as frame_file:
+            frame_file.write(image_bytes)
+        record["path"] = os.path.join("frames", filename)
+        return record
+    
+    def close(self, timeout=5):
+        """Flush outstanding records and stop the writer"""
+        if not self.enabled:
+            return
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            print("Session recorder queue did not drain; some records were lost")
+            return
+        self.writer_thread.join(timeout)
+        if self.dropped:
+            print(f"Session recorder dropped {self.dropped} records under load")
+
+def load_session(session_dir):
+    """Group a recorded session's records into one dict per question, in order"""
+    questions = {}
+    with open(os.path.join(session_dir, "session.jsonl"), encoding="utf-8") as log_file:
+        for line in log_file:
+            record = json.loads(line)
+            question = questions.setdefault(record["question"], {
+                "id": record["question"], "frame_path": None, "ocr_text": None, "ocr_time": None,
+                "results": {}, "consensus": None
+            })
+            
+            if record["type"] == "frame":
+                question["frame_path"] = os.path.join(session_dir, record["path"])
+            elif record["type"] == "ocr":
+                question["ocr_text"] = record["text"]
+                question["ocr_time"] = record["time"]
+            elif record["type"] == "result":
+                question["results"][record["model"]] = {
+                    "result": record["result"], "time": record["time"],
+                    "grounded": record.get("grounded"), "confidence": record.get("confidence")
+                }
+            elif record["type"] == "consensus":
+                question["consensus"] = record
+    
+    return [questions[question_id] for question_id in sorted(questions)]
@@ -0,0 +1,75 @@
+import threading
+from types import MappingProxyType
+
+EMPTY_RESULT = MappingProxyType({"result": None, "time": None})
+
+class ResultSnapshot:
+    """Immutable view of the question, per-model results and processing flag at one version"""
+    
+    __slots__ = ("version", "question", "results", "is_processing")
+    
+    def __init__(self, version, question, results, is_processing):
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "question", question)
+        object.__setattr__(self, "results", MappingProxyType(results))
+        object.__setattr__(self, "is_processing", is_processing)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("ResultSnapshot is immutable")
+
+class ResultState:
+    """Result state shared between worker threads and the renderer
+    
+    Workers publish changes, each of which atomically swaps in a new snapshot
+    with a higher version. The renderer reads the current snapshot without
+    locking and only redraws the overlay when the version has changed.
+    """
+    
+    def __init__(self, model_names):
+        self.lock = threading.Lock()
+        self.model_names = list(model_names)
+        self.current = ResultSnapshot(0, None, self._empty_results(), False)
+    
+    def _empty_results(self):
+        return {model_name: EMPTY_RESULT for model_name in self.model_names}
+    
+    def snapshot(self):
+        """Return the latest published snapshot"""
+        return self.current
+    
+    def _publish(self, model_result=None, **changes):
+        """Atomically swap in a new snapshot built from the current one plus changes
+        
+        changes may set question, results or is_processing; model_result is a
+        (model_name, result_data) pair merged into the current results.
+        """
+        with self.lock:
+            previous = self.current
+            results = changes.get("results", previous.results)
+            if model_result:
+                results = dict(results)
+                results[model_result[0]] = MappingProxyType(dict(model_result[1]))
+            
+            self.current = ResultSnapshot(
+                previous.version + 1,
+                changes.get("question", previous.question),
+                dict(results),
+                changes.get("is_processing", previous.is_processing)
+            )
+            return self.current
+    
+    def start(self):
+        """Clear the question and results for a new capture and mark processing"""
+        return self._publish(question=None, results=self._empty_results(), is_processing=True)
+    
+    def set_question(self, question):
+        """Publish the OCR'd question text"""
+        return self._publish(question=question)
+    
+    def set_result(self, model_name, result_data):
+        """Publish one model's result"""
+        return self._publish(model_result=(model_name, result_data))
+    
+    def finish(self):
+        """Mark processing as complete"""
+        return self._publish(is_processing=False)
@@ -0,0 +1,162 @@
+import concurrent.futures
+import functools
+import re
+import threading
+import time
+from ai.prompt_builder import PromptBuilder, ParsedQuestion
+from ai.grounding import needs_grounding
+
+def _words(text):
+    return set(re.findall(r"\w+", (text or "").lower()))
+
+def same_question(first, second, min_overlap=0.8):
+    """Whether two OCR reads are of the same question, tolerating a misread word"""
+    first_words, second_words = _words(first), _words(second)
+    if not first_words or not second_words:
+        return False
+    return len(first_words & second_words) / len(first_words | second_words) >= min_overlap
+
+class Speculator:
+    """Starts model calls on a question as soon as its text is stable, before the answer options settle
+    
+    Fed one OCR read at a time. Once the question has read the same twice,
+    each model is asked the question alone and the index is checked. Once the
+    options have also read the same twice, merge_tasks() matches each
+    speculative answer to an option locally, and only models whose answer
+    matches no option are asked again with the options. A different question
+    cancels the speculation.
+    """
+    
+    def __init__(self, ai_processors, knowledge_index=None, stable_reads=2, request_timeout=15.0):
+        self.ai_processors = ai_processors
+        self.knowledge_index = knowledge_index
+        self.stable_reads = stable_reads
+        self.request_timeout = request_timeout
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(ai_processors))
+        self.lock = threading.Lock()
+        self._reset(None)
+    
+    def _reset(self, question):
+        """Start tracking a new question"""
+        self.question = question
+        self.question_reads = 1
+        self.choices = None
+        self.choice_reads = 0
+        self.futures = {}
+        self.index_hit = None
+        self.speculated_at = None
+        self.settled = False
+    
+    def _read_choices(self, parsed):
+        """Count how many reads in a row have shown the same options"""
+        choices = tuple(choice.lower() for choice in parsed.choices) if len(parsed.choices) >= 2 else None
+        if choices and choices == self.choices:
+            self.choice_reads += 1
+        else:
+            self.choices = choices
+            self.choice_reads = 1 if choices else 0
+        return self.choice_reads >= self.stable_reads
+    
+    def observe(self, text):
+        """Feed one OCR read and return (event, parsed question)
+        
+        event is "new" for a question not seen before, "speculating" when
+        model calls start on the question alone, "settled" once the options
+        are stable and the question can be answered, and None otherwise.
+        """
+        parsed = PromptBuilder.parse(text)
+        if not parsed.question.endswith("?"):
+            return None, parsed
+        
+        with self.lock:
+            if self.question is None or not same_question(parsed.question, self.question):
+                self.cancel()
+                self._reset(parsed.question)
+                self._read_choices(parsed)
+                return "new", parsed
+            
+            if self.settled:
+                return None, parsed
+            
+            self.question_reads += 1
+            if self._read_choices(parsed):
+                # Options that settled with the question leave nothing to overlap, so skip speculating
+                self.settled = True
+                return "settled", parsed
+            
+            if self.question_reads >= self.stable_reads and self.speculated_at is None:
+                self._speculate(parsed)
+                return "speculating", parsed
+            
+            return None, parsed
+    
+    def _speculate(self, parsed):
+        """Ask every model the question alone and prefetch an index match"""
+        question_only = ParsedQuestion(parsed.question, [], parsed.raw_text)
+        grounded, _ = needs_grounding(question_only)
+        
+        self.speculated_at = time.monotonic()
+        self.futures = {
+            model_name: self.executor.submit(processor.process_text, parsed.question, grounded, self.request_timeout)
+            for model_name, processor in self.ai_processors.items()
+        }
+        if self.knowledge_index:
+            self.index_hit = self.knowledge_index.lookup(question_only)
+    
+    def index_result(self, parsed):
+        """The index answer matched to the settled options, or None
+        
+        Uses the prefetched match when the question was speculated on, and
+        looks the settled question up now when it was not.
+        """
+        start = time.monotonic()
+        index_hit = self.index_hit
+        if index_hit is None and self.knowledge_index:
+            index_hit = self.knowledge_index.lookup(parsed)
+        if not index_hit:
+            return None
+        
+        choice = PromptBuilder.match_choice(index_hit["answer"], parsed)
+        return {"result": choice, "time": time.monotonic() - start, "speculative": index_hit is self.index_hit} if choice else None
+    
+    def merge_tasks(self, parsed, grounded):
+        """Per-model tasks for DeadlineScheduler.run that answer the settled question"""
+        # Bound now, so a new question arriving before the tasks run can't swap in its own calls
+        with self.lock:
+            futures = dict(self.futures)
+        return {
+            model_name: functools.partial(self._merge, model_name, futures.get(model_name), parsed, grounded)
+            for model_name in self.ai_processors
+        }
+    
+    def _merge(self, model_name, future, parsed, grounded, timeout):
+        """Use the speculative answer if it names one option, otherwise ask again with the options"""
+        start = time.monotonic()
+        if future is not None:
+            # Started earlier, so it never finishes later than a fresh request would
+            try:
+                speculative = future.result(timeout=timeout)
+            except Exception:
+                speculative = None
+            
+            choice = PromptBuilder.match_choice(speculative["result"], parsed) if speculative else None
+            if choice:
+                return {
+                    "result": choice,
+                    "time": time.monotonic() - start,
+                    "grounded": speculative.get("grounded"),
+                    "speculative": True
+                }
+        
+        remaining = max(0.1, timeout - (time.monotonic() - start))
+        return self.ai_processors[model_name].process_text(parsed.raw_text, grounded, remaining)
+    
+    def cancel(self):
+        """Drop the current question's speculation; calls already in flight finish unobserved"""
+        for future in self.futures.values():
+            future.cancel()
+        self.futures = {}
+    
+    def close(self):
+        self.cancel()
+        self.executor.shutdown(wait=False)
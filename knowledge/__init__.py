@@ -0,0 +1 @@
+# Knowledge index package initialization
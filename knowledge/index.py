@@ -0,0 +1,145 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "by", "do", "does", "for", "from", "in", "is", "it",
+    "most", "of", "on", "or", "the", "these", "this", "to", "was", "what", "when", "where",
+    "which", "who", "with", "following"
+}
+
+DEFAULT_CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus.jsonl")
+
+# Question/answer rows with an external-content FTS5 index kept in sync by triggers
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    question TEXT UNIQUE NOT NULL,
+    answer TEXT NOT NULL,
+    source TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    question, content = 'entries', content_rowid = 'id', tokenize = 'porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts (rowid, question) VALUES (new.id, new.question);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts (entries_fts, rowid, question) VALUES ('delete', old.id, old.question);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_au AFTER UPDATE ON entries BEGIN
+    INSERT INTO entries_fts (entries_fts, rowid, question) VALUES ('delete', old.id, old.question);
+    INSERT INTO entries_fts (rowid, question) VALUES (new.id, new.question);
+END;
+"""
+
+def tokenize(text):
+    """Lowercase content words used for matching and overlap scoring"""
+    return [word for word in re.findall(r"[a-z0-9]+", text.lower()) if word not in STOPWORDS]
+
+class KnowledgeIndex:
+    """BM25 retrieval over curated trivia and previously answered questions
+    
+    Backed by a SQLite FTS5 table, memory-mapped so opening a large index is
+    near-instant, and updated incrementally as new questions are answered.
+    """
+    
+    def __init__(self, db_path="knowledge.db", corpus_path=DEFAULT_CORPUS_PATH, min_overlap=0.7, mmap_size=256 * 1024 * 1024):
+        self.db_path = db_path
+        self.min_overlap = min_overlap
+        self.lock = threading.Lock()
+        
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.executescript(SCHEMA)
+        
+        # Seed a fresh index with the curated corpus
+        if len(self) == 0 and corpus_path and os.path.exists(corpus_path):
+            count = self.import_jsonl(corpus_path, source="curated")
+            print(f"Knowledge index seeded with {count} curated entries")
+    
+    def __len__(self):
+        with self.lock:
+            return self.connection.execute("SELECT count(*) FROM entries").fetchone()[0]
+    
+    def add(self, question, answer, source="answered"):
+        """Add or update a single question/answer pair"""
+        self.add_many([(question, answer)], source=source)
+    
+    def add_many(self, entries, source="answered"):
+        """Add or update question/answer pairs in one transaction"""
+        with self.lock:
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT INTO entries (question, answer, source) VALUES (?, ?, ?) "
+                    "ON CONFLICT (question) DO UPDATE SET answer = excluded.answer, source = excluded.source",
+                    [(question, answer, source) for question, answer in entries]
+                )
+    
+    def import_jsonl(self, path, source="curated"):
+        """Import {"question": ..., "answer": ...} lines and return how many were added"""
+        entries = []
+        with open(path, encoding="utf-8") as corpus_file:
+            for line in corpus_file:
+                if line.strip():
+                    entry = json.loads(line)
+                    entries.append((entry["question"], entry["answer"]))
+        
+        self.add_many(entries, source=source)
+        return len(entries)
+    
+    def search(self, terms, limit=3):
+        """Return the top BM25 matches containing every term as (question, answer, score) tuples"""
+        if not terms:
+            return []
+        
+        # AND-ing the terms keeps the candidate set (and so the ranking cost) small at any index size
+        query = " AND ".join(f'"{term}"' for term in terms)
+        with self.lock:
+            return self.connection.execute(
+                "SELECT entries.question, entries.answer, bm25(entries_fts) FROM entries_fts "
+                "JOIN entries ON entries.id = entries_fts.rowid WHERE entries_fts MATCH ? "
+                "ORDER BY bm25(entries_fts) LIMIT ?",
+                (query, limit)
+            ).fetchall()
+    
+    def candidates(self, question):
+        """Yield matches for the full question, then with each single term left out to tolerate one OCR misread"""
+        terms = sorted(set(tokenize(question)))
+        yield from self.search(terms)
+        
+        if len(terms) > 3:
+            for i in range(len(terms)):
+                yield from self.search(terms[:i] + terms[i + 1:], limit=1)
+    
+    def lookup(self, parsed):
+        """Return a high-confidence answer for a parsed question, or None
+        
+        A match is only trusted when it covers nearly the same content words as
+        the question and, when choices were read, its answer is one of them.
+        """
+        query_terms = set(tokenize(parsed.question))
+        
+        for question, answer, score in self.candidates(parsed.question):
+            match_terms = set(tokenize(question))
+            overlap = len(query_terms & match_terms) / len(query_terms | match_terms)
+            if overlap < self.min_overlap:
+                continue
+            
+            if parsed.choices:
+                choice = next((c for c in parsed.choices if c.strip().lower() == answer.strip().lower()), None)
+                if choice is None:
+                    continue
+                answer = choice
+            
+            return {"answer": answer, "question": question, "score": -score, "overlap": overlap}
+        
+        return None
+    
+    def close(self):
+        """Close the underlying database"""
+        with self.lock:
+            self.connection.close()
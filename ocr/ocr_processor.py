@@ -9,15 +9,19 @@ class OCRProcessor:
     
     def extract_text(self, image_path):
         """Extract text from the image using Google Cloud Vision OCR"""
-        print("Extracting text with OCR...")
-        
         with open(image_path, 'rb') as image_file:
             content = image_file.read()
         
+        return self.extract_text_from_bytes(content)
+    
+    def extract_text_from_bytes(self, content, timeout=None):
+        """Extract text from encoded image bytes using Google Cloud Vision OCR, giving up after timeout seconds"""
+        print("Extracting text with OCR...")
+        
         image = vision.Image(content=content)
         
         # text detection
-        response = self.vision_client.text_detection(image=image)
+        response = self.vision_client.text_detection(image=image, timeout=timeout)
         texts = response.text_annotations
         
         if len(texts) == 0:
@@ -0,0 +1,51 @@
+from ai.prompt_builder import PromptBuilder
+from core.deadline import read_countdown
+
+# The first three OCR blocks are as recorded in winning_output.txt; the rest
+# are made up to cover option shapes that session didn't show
+
+def test_drops_logo_below_the_options():
+    parsed = PromptBuilder.parse(
+        "114,952\nL\nWhich federal agency is responsible\nfor regulating the stock market?\n"
+        "Federal Trade Commission\nFederal Reserve System\nSecurities & Exchange Commission\nGOCLA"
+    )
+    assert parsed.question == "Which federal agency is responsible for regulating the stock market?"
+    assert parsed.choices == ["Federal Trade Commission", "Federal Reserve System", "Securities & Exchange Commission"]
+
+def test_drops_times_up_banner_from_the_question():
+    parsed = PromptBuilder.parse(
+        "3,297\nTIME'S UP\n0\nL\nWhich of these stocks had the highest\npercentage returns from the start of\n"
+        "2024 to the end of 2024?\nAppLovin APP\nPalantir (PLTR)\nNvidia (NVDA)"
+    )
+    assert parsed.question == "Which of these stocks had the highest percentage returns from the start of 2024 to the end of 2024?"
+    assert parsed.choices == ["AppLovin APP", "Palantir (PLTR)", "Nvidia (NVDA)"]
+    assert read_countdown(parsed.raw_text) == 0
+
+def test_drops_stray_glyphs_and_keeps_choices():
+    parsed = PromptBuilder.parse(
+        "134,880\nO\nWhat is the underlying technology of\nmost cryptocurrencies like Bitcoin and\nEthereum?\n"
+        "Blockchain\nL\nCloud Computing\nThe Internet of Things"
+    )
+    assert parsed.question == "What is the underlying technology of most cryptocurrencies like Bitcoin and Ethereum?"
+    assert parsed.choices == ["Blockchain", "Cloud Computing", "The Internet of Things"]
+
+def test_keeps_single_digit_choices():
+    parsed = PromptBuilder.parse("How many times a year do US-based\npublic companies report on their\nearnings?\n1\n2\n4")
+    assert parsed.choices == ["1", "2", "4"]
+    assert PromptBuilder.resolve_answer("C", parsed) == "4"
+    
+    parsed = PromptBuilder.parse("How many companies are in the Dow?\n5\n30\n100")
+    assert parsed.choices == ["5", "30", "100"]
+
+def test_keeps_all_caps_options():
+    parsed = PromptBuilder.parse("Which agency insures bank deposits?\nFDIC\nSEC\nFINRA\nOCC")
+    assert parsed.choices == ["FDIC", "SEC", "FINRA", "OCC"]
+
+def test_keeps_acronym_as_last_option():
+    parsed = PromptBuilder.parse(
+        "Where is Apple listed?\nLondon Stock Exchange\nTokyo Stock Exchange\nEuronext\nNASDAQ"
+    )
+    assert parsed.choices == ["London Stock Exchange", "Tokyo Stock Exchange", "Euronext", "NASDAQ"]
+    
+    parsed = PromptBuilder.parse("Which of these was created by Ripple Labs?\nBitcoin\nEthereum\nSolana\nXRP")
+    assert parsed.choices == ["Bitcoin", "Ethereum", "Solana", "XRP"]
@@ -1,8 +1,27 @@
 import cv2
+import numpy as np
+from core.consensus import CONFIDENT_ANSWER
+
+# Display name and overlay color for each model key, in display order
+MODEL_STYLES = {
+    "index": ("Index", (255, 255, 255)),     # Knowledge index in white
+    "local": ("Local", (200, 200, 200)),     # Local model in grey
+    "gpt4": ("GPT-4", (255, 200, 0)),        # GPT-4 in yellowish
+    "sonar_pro": ("Sonar Pro", (0, 255, 100)),  # Sonar Pro in green
+    "sonar": ("Sonar", (0, 200, 255)),       # Sonar in orange
+    "gemini": ("Gemini", (255, 100, 200)),   # Gemini in purple
+    "gpt4_image": ("GPT-4 (image)", (255, 230, 120)),  # GPT-4 image path in light yellow
+    "gemini_image": ("Gemini (image)", (255, 150, 230))  # Gemini image path in light purple
+}
 
 class TextRenderer:
     """Handles text rendering with wrapping and formatting"""
     
+    def __init__(self):
+        # Overlay layer for the last rendered result snapshot, keyed by (version, frame shape)
+        self.overlay_cache_key = None
+        self.overlay_cache = None
+    
     @staticmethod
     def wrap_text(text, font_face, font_scale, max_width):
         """Split text into lines that fit within max_width"""
@@ -31,6 +50,47 @@ class TextRenderer:
         
         return lines
     
+    @staticmethod
+    def overlay_height(height, results):
+        """Height of the results panel at the bottom of the frame"""
+        return min(max(250, 110 + 40 * (len(results) + 1)), height * 2 // 3)
+    
+    @staticmethod
+    def render_frame_stats(display_frame, text):
+        """Draw the frame-time line in the top-right corner; it changes every frame, so it is never cached"""
+        if not text:
+            return display_frame
+        (text_width, _), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+        cv2.putText(display_frame, text, (display_frame.shape[1] - text_width - 10, 30), 
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
+        return display_frame
+    
+    def render_snapshot_overlay(self, frame, snapshot):
+        """Render a result snapshot's overlay, redrawing the text only when the snapshot version changes
+        
+        The overlay is drawn once per version onto a black and a white canvas;
+        pixels that come out identical on both are text, everything else is
+        background. Each frame then only needs the panel shading and a masked copy.
+        """
+        cache_key = (snapshot.version, frame.shape)
+        if cache_key != self.overlay_cache_key:
+            args = (snapshot.question, snapshot.results, snapshot.is_processing)
+            on_black = self.render_result_overlay(np.zeros(frame.shape, np.uint8), *args)
+            on_white = self.render_result_overlay(np.full(frame.shape, 255, np.uint8), *args)
+            mask = (on_black == on_white).all(axis=2, keepdims=True)
+            shade_top = frame.shape[0] - self.overlay_height(frame.shape[0], snapshot.results) if snapshot.question else None
+            self.overlay_cache = (on_black, mask, shade_top)
+            self.overlay_cache_key = cache_key
+        
+        layer, mask, shade_top = self.overlay_cache
+        display_frame = frame.copy()
+        
+        # Same blend as the panel in render_result_overlay: 70% black over the frame
+        if shade_top is not None:
+            display_frame[shade_top:] = cv2.convertScaleAbs(display_frame[shade_top:], alpha=0.3)
+        np.copyto(display_frame, layer, where=mask)
+        return display_frame
+    
     @staticmethod
     def render_result_overlay(frame, question_text, results, is_processing):
         """Render an overlay with question and results on the frame"""
@@ -52,7 +112,7 @@ class TextRenderer:
         # Create a black background overlay at the bottom if we have results
         if question_text:
             height, width = display_frame.shape[:2]
-            overlay_height = min(250, height // 2)
+            overlay_height = TextRenderer.overlay_height(height, results)
             overlay = display_frame.copy()
             cv2.rectangle(overlay, (0, height-overlay_height), (width, height), (0, 0, 0), -1)
             
@@ -67,7 +127,7 @@ class TextRenderer:
             models_completed = sum(1 for model in results.values() if model["result"] is not None)
             
             # Show progress or results header
-            header_text = f"Triple Check Progress: {models_completed}/3" if is_processing else "Triple Check Results"
+            header_text = f"Triple Check Progress: {models_completed}/{len(results)}" if is_processing else "Triple Check Results"
             cv2.putText(display_frame, header_text, 
                       (10, height-overlay_height+30), 
                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
@@ -81,33 +141,36 @@ class TextRenderer:
             y_pos = height-overlay_height+110
             
             # Display all model results
-            for model_name, color in [
-                ("gpt4", (255, 200, 0)),      # GPT-4 in yellowish
-                ("sonar_pro", (0, 255, 100)),  # Sonar Pro in green
-                ("sonar", (0, 200, 255))       # Sonar in orange
-            ]:
+            model_names = [name for name in MODEL_STYLES if name in results]
+            model_names += [name for name in results if name not in MODEL_STYLES]
+            for model_name in model_names:
+                display_name, color = MODEL_STYLES.get(model_name, (model_name.replace("_", " ").title(), (255, 255, 255)))
                 model_data = results[model_name]
-                display_name = "GPT-4" if model_name == "gpt4" else model_name.replace("_", " ").title()
                 
                 if not is_processing and not model_data["result"]:
                     continue
                     
                 model_text = f"{display_name}: {model_data['result']} ({model_data['time']:.2f}s)" if model_data["result"] else f"{display_name}: Processing..."
+                if model_data["result"] and model_data.get("confidence") is not None:
+                    model_text = f"{model_text[:-1]}, {model_data['confidence']:.0%})"
                 cv2.putText(display_frame, model_text, (10, y_pos), 
                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
                 y_pos += 40
             
             # Show consensus if all are in
-            if models_completed == 3:
-                gpt4_result = results["gpt4"]["result"]
-                sonar_pro_result = results["sonar_pro"]["result"]
-                sonar_result = results["sonar"]["result"]
-                
-                if gpt4_result == sonar_pro_result == sonar_result:
+            if models_completed == len(results):
+                if len(set(model["result"] for model in results.values())) == 1:
                     cv2.putText(display_frame, "All models agree!", (10, y_pos), 
                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
                 else:
                     cv2.putText(display_frame, "models disagree - check console", (10, y_pos), 
                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+            else:
+                # A single high-confidence answer is worth showing before the rest are in
+                confident = [model for model in results.values() if model["result"] and (model.get("confidence") or 0.0) >= CONFIDENT_ANSWER]
+                if confident:
+                    best = max(confident, key=lambda model: model["confidence"])
+                    cv2.putText(display_frame, f"Confident: {best['result']} ({best['confidence']:.0%})", (10, y_pos), 
+                              cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
         
         return display_frame 
\ No newline at end of file